@@ -16,12 +16,13 @@ import sys
 import json
 import time
 import tempfile
+import itertools
 
 # Add project paths
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -31,10 +32,10 @@ load_dotenv()
 from services.wallet import create_anonymous_wallet, wallet_from_mnemonic
 from services.encryption import (
     generate_encryption_key,
-    encrypt_files_to_bundle,
+    encrypt_files_to_bundle_stream,
     key_to_hex,
 )
-from services.ipfs_upload import upload_bytes_to_ipfs, get_ipfs_url
+from services.ipfs_upload import upload_stream_to_ipfs, get_ipfs_url
 from services.algorand_client import get_algod_client, check_connection
 from services.submission_store import (
     store_submission, get_submission, get_all_submissions,
@@ -58,7 +59,7 @@ from services.verification import (
     reveal_verdict,
     finalize_verification,
     get_verification_status,
-    get_all_verification_sessions,
+    iter_sessions,
     get_inspector_reputation,
     generate_commit_hash,
     VERDICT_AUTHENTIC,
@@ -95,6 +96,11 @@ from services.publication_bot import (
     get_publication_stats,
 )
 
+# Counter part of evidence IDs assigned without an app id. Seeded from the
+# clock so IDs differ across restarts; next() is atomic, so concurrent
+# submissions never share an ID.
+_offchain_evidence_counter = itertools.count(int(time.time()) % 100000)
+
 app = FastAPI(
     title="WhistleChain API",
     description="Decentralized Whistleblower Protection & Bounty Protocol",
@@ -308,16 +314,15 @@ async def submit_evidence(
                 f.write(content)
             file_paths.append(file_path)
 
-        # Step 3: Encrypt
+        # Step 3: Encrypt (streamed during the upload below)
         encryption_key = generate_encryption_key()
-        encrypted_bundle = encrypt_files_to_bundle(file_paths, encryption_key)
 
         # Step 4: Upload to IPFS
         ipfs_hash = None
         try:
-            ipfs_result = upload_bytes_to_ipfs(
-                encrypted_bundle,
-                filename=f"whistlechain_evidence_{int(time.time())}.json",
+            ipfs_result = upload_stream_to_ipfs(
+                encrypt_files_to_bundle_stream(file_paths, encryption_key),
+                filename=f"whistlechain_evidence_{int(time.time())}.bin",
             )
             ipfs_hash = ipfs_result["IpfsHash"]
         except Exception:
@@ -326,7 +331,7 @@ async def submit_evidence(
         # Step 5: Algorand anchoring + stake locking
         tx_id = None
         block = None
-        evidence_id = f"EVD-{time.strftime('%Y')}-{int(time.time()) % 100000:05d}"
+        evidence_id = f"EVD-{time.strftime('%Y')}-{next(_offchain_evidence_counter) % 100000:05d}"
         stake_locked = False
 
         app_id = os.getenv("EVIDENCE_REGISTRY_APP_ID", "")
@@ -616,9 +621,13 @@ async def api_verification_status(evidence_id: str):
 
 
 @app.get("/verification/sessions")
-async def api_all_sessions():
-    """Get all verification sessions (active + completed)."""
-    return get_all_verification_sessions()
+async def api_all_sessions(
+    limit: int | None = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    phase: str = None,
+):
+    """Get verification sessions (active + completed), optionally paginated / filtered by phase."""
+    return list(iter_sessions(limit=limit, offset=offset, phase=phase))
 
 
 @app.post("/verification/generate-commit")
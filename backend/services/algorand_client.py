@@ -6,6 +6,16 @@ and oracle services.
 """
 
 import os
+import copy
+import queue
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from algosdk import constants, error, transaction
 from algosdk.v2client import algod, indexer
 from dotenv import load_dotenv
 
@@ -20,15 +30,224 @@ DEFAULT_INDEXER_SERVER = "https://testnet-idx.algonode.cloud"
 DEFAULT_INDEXER_PORT = 443
 DEFAULT_INDEXER_TOKEN = ""
 
+# Suggested params only move forward a round every ~3s and stay valid for
+# 1000 rounds, so a short-lived cache is safe to share across transactions.
+SUGGESTED_PARAMS_TTL_SECONDS = 10
+
+# (token, server) -> (params, fetched_at); keyed like _algod_clients so
+# params from one node are never served for another
+_suggested_params_cache: dict[tuple[str, str], tuple[transaction.SuggestedParams, float]] = {}
+
+# Evidence Registry method selectors (first 4 bytes of SHA-512/256 of the
+# signature), passed as ApplicationArgs[0]. Mirrors METHOD_SIGNATURES in
+# smart-contracts/contracts/evidence_registry.py.
+METHOD_SIGNATURES = {
+    "submit_evidence": "submit_evidence(byte[],byte)void",
+    "update_status": "update_status(byte[],byte[])void",
+    "get_evidence": "get_evidence(byte[])void",
+    "refund_stake": "refund_stake(byte[],uint64,address)void",
+    "forfeit_stake": "forfeit_stake(byte[],uint64)void",
+    "begin_verification": "begin_verification(byte[],uint64,uint64)void",
+    "commit_verdict": "commit_verdict(byte[],byte[32])void",
+    "reveal_verdict": "reveal_verdict(byte[],uint64,byte[],byte[])void",
+    "finalize_verification": "finalize_verification(byte[],byte[],byte[])void",
+    "resolve_evidence": "resolve_evidence(byte[],uint64,address,uint64,byte[])void",
+    "publish_evidence": "publish_evidence(byte[],byte[],byte[])void",
+}
+
+METHOD_SELECTORS = {
+    name: hashlib.new("sha512_256", sig.encode("utf-8")).digest()[:4]
+    for name, sig in METHOD_SIGNATURES.items()
+}
+
+
+def _new_algod_session(pool_connections: int = 16, pool_maxsize: int = 32) -> requests.Session:
+    """Build a keep-alive session for algod with connection-level retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One keep-alive session for every algod call; the SDK's default transport
+# (urllib) opens a new TCP/TLS connection per request. Retries only cover
+# connection failures and idempotent methods, never a transaction POST.
+_algod_session = _new_algod_session()
+
+# Clients keyed by (token, server) so env changes still take effect
+_algod_clients: dict[tuple[str, str], algod.AlgodClient] = {}
+_algod_pools: dict[tuple[str, str], "AlgodPool"] = {}
+_algod_pools_lock = threading.Lock()
+
+DEFAULT_ALGOD_POOL_SIZE = min(8, (os.cpu_count() or 1) * 2)
+
+
+class _PooledAlgodClient(algod.AlgodClient):
+    """
+    AlgodClient that sends requests through a keep-alive requests.Session.
+
+    algod_request mirrors AlgodClient.algod_request from py-algorand-sdk
+    2.12 (the version pinned in requirements.txt); re-check it on upgrade.
+    """
+
+    def __init__(self, algod_token, algod_address, headers=None, session=None):
+        super().__init__(algod_token, algod_address, headers)
+        self.session = session if session is not None else _algod_session
+
+    def algod_request(
+        self,
+        method,
+        requrl,
+        params=None,
+        data=None,
+        headers=None,
+        response_format="json",
+        timeout=30,
+    ):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = algod.api_version_path_prefix + requrl
+
+        try:
+            resp = self.session.request(
+                method,
+                self.algod_address + requrl,
+                params=params or None,
+                data=data,
+                headers=header,
+                timeout=timeout,
+            )
+        except requests.RequestException as e:
+            # Keep transport failures inside the SDK's error hierarchy
+            raise error.AlgodHTTPError(f"algod request failed: {e}") from e
+        if resp.status_code >= 400:
+            try:
+                body = resp.json()
+                message = body["message"]
+            except (ValueError, KeyError, TypeError):
+                body, message = {}, resp.text
+            raise error.AlgodHTTPError(message, resp.status_code, body.get("data"))
+
+        if response_format != "json":
+            return resp.content
+        if resp.status_code == 200 and not resp.content:
+            # Some algod endpoints answer 200 with an empty body
+            return {}
+        try:
+            return resp.json()
+        except ValueError as e:
+            raise error.AlgodResponseError(
+                "Failed to parse JSON response from algod"
+            ) from e
+
 
 def get_algod_client() -> algod.AlgodClient:
-    """Create and return an Algorand algod client for testnet."""
+    """Return the shared Algorand algod client for testnet."""
     server = os.getenv("ALGOD_SERVER", DEFAULT_ALGOD_SERVER)
     token = os.getenv("ALGOD_TOKEN", DEFAULT_ALGOD_TOKEN)
-    port = os.getenv("ALGOD_PORT", str(DEFAULT_ALGOD_PORT))
 
-    # AlgoNode doesn't need a token but the SDK requires the param
-    return algod.AlgodClient(token, server)
+    client = _algod_clients.get((token, server))
+    if client is None:
+        # AlgoNode doesn't need a token but the SDK requires the param
+        client = _PooledAlgodClient(token, server)
+        _algod_clients[(token, server)] = client
+    return client
+
+
+class AlgodPool:
+    """
+    Fixed-size pool of algod clients, each with its own keep-alive session.
+
+    Clients are created lazily up to maxsize; once all are checked out,
+    acquire() blocks until one is released. Use connection() in request
+    handlers so the client always goes back to the pool:
+
+        with get_algod_pool().connection() as client:
+            client.status()
+    """
+
+    def __init__(self, token: str, server: str, maxsize: int = DEFAULT_ALGOD_POOL_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.token = token
+        self.server = server
+        self.maxsize = maxsize
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> algod.AlgodClient:
+        """Check out a client, creating one if the pool isn't full yet."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.maxsize:
+                self._created += 1
+                return _PooledAlgodClient(
+                    self.token,
+                    self.server,
+                    session=_new_algod_session(pool_connections=1, pool_maxsize=1),
+                )
+        # queue.Empty propagates if the timeout expires
+        return self._idle.get(timeout=timeout)
+
+    def release(self, client: algod.AlgodClient) -> None:
+        """Return a client obtained from acquire() to the pool."""
+        self._idle.put_nowait(client)
+
+    @contextmanager
+    def connection(self, timeout: float | None = None):
+        """Context manager pairing acquire() with release()."""
+        client = self.acquire(timeout)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+
+def get_algod_pool() -> AlgodPool:
+    """Return the shared algod client pool for the configured node."""
+    server = os.getenv("ALGOD_SERVER", DEFAULT_ALGOD_SERVER)
+    token = os.getenv("ALGOD_TOKEN", DEFAULT_ALGOD_TOKEN)
+
+    with _algod_pools_lock:
+        pool = _algod_pools.get((token, server))
+        if pool is None:
+            pool = AlgodPool(token, server)
+            _algod_pools[(token, server)] = pool
+    return pool
+
+
+def get_suggested_params(
+    client: algod.AlgodClient,
+    max_age: float = SUGGESTED_PARAMS_TTL_SECONDS,
+) -> transaction.SuggestedParams:
+    """
+    Return suggested params, reusing a recent fetch when still fresh.
+
+    A copy is returned so callers can tweak fee fields (e.g. flat_fee)
+    without affecting other transactions built from the cache.
+    """
+    key = (client.algod_token, client.algod_address)
+    now = time.monotonic()
+    cached, fetched_at = _suggested_params_cache.get(key, (None, 0.0))
+    if cached is None or now - fetched_at > max_age:
+        cached = client.suggested_params()
+        _suggested_params_cache[key] = (cached, now)
+    return copy.copy(cached)
 
 
 def get_indexer_client() -> indexer.IndexerClient:
@@ -41,8 +260,8 @@ def get_indexer_client() -> indexer.IndexerClient:
 
 def check_connection() -> dict:
     """Verify algod is reachable and return node status."""
-    client = get_algod_client()
-    status = client.status()
+    with get_algod_pool().connection() as client:
+        status = client.status()
     return {
         "last_round": status["last-round"],
         "last_version": status.get("last-version", ""),
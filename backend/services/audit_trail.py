@@ -33,9 +33,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from algosdk import transaction, account, encoding
 from dotenv import load_dotenv
 
-from services.algorand_client import get_algod_client
+try:
+    # Optional: faster serialization of the on-chain audit summary
+    import orjson
+except ImportError:
+    orjson = None
+
+from services.algorand_client import get_algod_client, METHOD_SELECTORS
 from services.verification import (
     _verification_sessions,
+    _fmt_ns,
     get_verification_status,
 )
 from services.resolution import (
@@ -45,6 +52,10 @@ from services.resolution import (
 
 load_dotenv()
 
+# Evidence box status written by publish_evidence; STATUS_PUBLISHED in
+# contracts/evidence_registry.py
+STATUS_PUBLISHED = 4
+
 # ─── Audit Trail Store ───
 _audit_records: dict[str, dict] = {}
 _published_evidence: dict[str, dict] = {}
@@ -209,11 +220,11 @@ def _build_audit_trail(
     """
     # Timeline
     timeline = {
-        "submitted_at": session.get("started_at", ""),
-        "verification_started": session.get("started_at", ""),
+        "submitted_at": _fmt_ns(session.get("started_ts")),
+        "verification_started": _fmt_ns(session.get("started_ts")),
         "verification_window_hours": session.get("window_hours", 0),
-        "verification_deadline": session.get("window_end_formatted", ""),
-        "finalized_at": session.get("finalized_at", ""),
+        "verification_deadline": _fmt_ns(session.get("window_end", 0) * 1_000_000_000),
+        "finalized_at": _fmt_ns(session.get("finalized_ts")),
     }
 
     if resolution:
@@ -235,9 +246,9 @@ def _build_audit_trail(
     for addr, reveal in session.get("reveals", {}).items():
         inspector_verdicts.append({
             "inspector_id": addr[:8] + "..." + addr[-4:],  # anonymized
-            "verdict": reveal.get("verdict_label", "UNKNOWN"),
-            "justification_ipfs": reveal.get("justification_ipfs", ""),
-            "revealed_at": reveal.get("revealed_at", ""),
+            "verdict": reveal.verdict_label,
+            "justification_ipfs": reveal.justification_ipfs,
+            "revealed_at": _fmt_ns(reveal.revealed_ts),
         })
 
     # On-chain references
@@ -278,6 +289,18 @@ def _make_evidence_box_key(evidence_id: str) -> bytes:
     return b"EVD-" + counter.to_bytes(8, "big")
 
 
+def serialize_audit(summary: dict) -> bytes:
+    """
+    Serialize an audit summary to compact JSON bytes.
+    Use this to build the audit_summary arg for publish_evidence.
+    """
+    if orjson is not None:
+        return orjson.dumps(summary)
+    return json.dumps(
+        summary, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
 def _publish_onchain(
     app_id: int,
     admin_pk: str,
@@ -293,15 +316,8 @@ def _publish_onchain(
     admin_addr = account.address_from_private_key(admin_pk)
     box_key = _make_evidence_box_key(evidence_id)
 
-    # Build updated evidence blob (PUBLISHED status)
-    updated_blob = (
-        f"published|{evidence_id}|status=PUBLISHED|"
-        f"verdict={audit_trail.get('verification_summary', {}).get('final_verdict', '')}|"
-        f"published_at={int(time.time())}"
-    ).encode("utf-8")
-
     # Build audit summary JSON for on-chain storage
-    audit_summary = json.dumps({
+    audit_summary = serialize_audit({
         "evidence_id": evidence_id,
         "category": audit_trail.get("category", ""),
         "timeline": audit_trail.get("timeline", {}),
@@ -310,7 +326,7 @@ def _publish_onchain(
         "inspector_count": audit_trail.get("verification_summary", {}).get("total_inspectors", 0),
         "resolution_action": audit_trail.get("resolution", {}).get("resolution_action", ""),
         "published_at": int(time.time()),
-    }).encode("utf-8")
+    })
 
     # Audit box key
     audit_box_key = b"AUD-" + box_key[4:]
@@ -321,9 +337,9 @@ def _publish_onchain(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"publish_evidence",
+            METHOD_SELECTORS["publish_evidence"],
             box_key,
-            updated_blob,
+            STATUS_PUBLISHED.to_bytes(8, "big"),  # written into the box header
             audit_summary,
         ],
         boxes=[
@@ -4,15 +4,30 @@ WhistleChain — AES-256 File Encryption Module
 Encrypts evidence files before IPFS upload so that only the
 whistleblower (who holds the key) can decrypt them.
 
-Uses AES-256-GCM for authenticated encryption.
+Uses AES-256-GCM for authenticated encryption (pycryptodome, which
+dispatches to AES-NI + PCLMULQDQ on CPUs that support them).
 """
 
 import os
 import json
 import base64
+import struct
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 
+# Binary bundle layout (encrypt_files_to_bundle_fast):
+#   MAGIC | nonce (12) | ciphertext | tag (16)
+# where the plaintext is every file packed back to back as
+#   name_len (u16) | size (u64) | name (utf-8) | data
+# and encrypted with a single AES-GCM call.
+BUNDLE_MAGIC = b"WCB2"
+GCM_NONCE_SIZE = 12
+GCM_TAG_SIZE = 16
+_FILE_HEADER = struct.Struct(">HQ")
+
+# Plaintext read / ciphertext yield size for streamed bundles
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def generate_encryption_key() -> bytes:
     """Generate a random 256-bit AES key."""
@@ -101,17 +116,123 @@ def encrypt_files_to_bundle(file_paths: list[str], key: bytes) -> bytes:
     return json.dumps(bundle, indent=2).encode("utf-8")
 
 
+def encrypt_files_to_bundle_fast(file_paths: list[str], key: bytes) -> bytes:
+    """
+    Encrypt multiple files into a compact binary bundle.
+
+    All files are read straight into one preallocated, length-prefixed
+    buffer which is then encrypted in place with a single AES-256-GCM
+    call, so the key schedule and GHASH setup run once per bundle rather
+    than once per file, and no base64 / JSON encoding is needed.
+
+    Args:
+        file_paths: List of file paths to encrypt.
+        key: 32-byte AES key.
+
+    Returns:
+        Binary bundle bytes ready for IPFS upload (see BUNDLE_MAGIC layout).
+
+    Raises:
+        ValueError: If a file's size changes between the stat and the read.
+    """
+    entries, total = _bundle_entries(file_paths)
+    header_len = len(BUNDLE_MAGIC) + GCM_NONCE_SIZE
+    out = bytearray(header_len + total + GCM_TAG_SIZE)
+    view = memoryview(out)
+
+    pos = header_len
+    for fp, name, size in entries:
+        _FILE_HEADER.pack_into(out, pos, len(name), size)
+        pos += _FILE_HEADER.size
+        view[pos:pos + len(name)] = name
+        pos += len(name)
+        with open(fp, "rb") as f:
+            if f.readinto(view[pos:pos + size]) != size or f.read(1):
+                raise ValueError(f"{fp} changed size while being bundled")
+        pos += size
+
+    nonce = get_random_bytes(GCM_NONCE_SIZE)
+    payload = view[header_len:header_len + total]
+    cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+    cipher.encrypt(payload, output=payload)
+
+    view[:len(BUNDLE_MAGIC)] = BUNDLE_MAGIC
+    view[len(BUNDLE_MAGIC):header_len] = nonce
+    view[header_len + total:] = cipher.digest()
+    return bytes(out)
+
+
+def encrypt_files_to_bundle_stream(
+    file_paths: list[str],
+    key: bytes,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+):
+    """
+    Stream the same binary bundle as encrypt_files_to_bundle_fast.
+
+    Files are read and encrypted chunk by chunk with one running AES-GCM
+    cipher, so memory stays at ~chunk_size regardless of evidence size.
+    The concatenated output is byte-for-byte a BUNDLE_MAGIC bundle.
+
+    Yields:
+        Bundle byte chunks (header, ciphertext pieces, then the GCM tag).
+
+    Raises:
+        ValueError: If a file's size changes between the upfront stat and
+            the read, since the length already written would be wrong.
+    """
+    entries, _ = _bundle_entries(file_paths)
+    nonce = get_random_bytes(GCM_NONCE_SIZE)
+    cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+    yield BUNDLE_MAGIC + nonce
+
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    for fp, name, size in entries:
+        yield cipher.encrypt(_FILE_HEADER.pack(len(name), size) + name)
+        remaining = size
+        with open(fp, "rb") as f:
+            while remaining:
+                n = f.readinto(view[:min(chunk_size, remaining)])
+                if not n:
+                    raise ValueError(f"{fp} shrank while being bundled")
+                remaining -= n
+                yield cipher.encrypt(view[:n])
+            if f.read(1):
+                raise ValueError(f"{fp} grew while being bundled")
+
+    yield cipher.digest()
+
+
+def _bundle_entries(file_paths: list[str]) -> tuple[list[tuple[str, bytes, int]], int]:
+    """Collect (path, name, size) per file and the packed plaintext length."""
+    entries = []
+    total = 0
+    for fp in file_paths:
+        name = os.path.basename(fp).encode("utf-8")
+        size = os.stat(fp).st_size
+        entries.append((fp, name, size))
+        total += _FILE_HEADER.size + len(name) + size
+    return entries, total
+
+
 def decrypt_bundle(bundle_bytes: bytes, key: bytes) -> dict[str, bytes]:
     """
-    Decrypt a JSON bundle back into individual files.
+    Decrypt a bundle back into individual files.
+
+    Accepts both the JSON bundle from encrypt_files_to_bundle and the
+    binary bundle from encrypt_files_to_bundle_fast.
 
     Args:
-        bundle_bytes: The JSON bundle from encrypt_files_to_bundle.
+        bundle_bytes: The bundle bytes.
         key: 32-byte AES key.
 
     Returns:
         Dict mapping filename → decrypted bytes.
     """
+    if bundle_bytes[:len(BUNDLE_MAGIC)] == BUNDLE_MAGIC:
+        return _decrypt_binary_bundle(bundle_bytes, key)
+
     bundle = json.loads(bundle_bytes)
     result = {}
 
@@ -126,6 +247,27 @@ def decrypt_bundle(bundle_bytes: bytes, key: bytes) -> dict[str, bytes]:
     return result
 
 
+def _decrypt_binary_bundle(bundle_bytes: bytes, key: bytes) -> dict[str, bytes]:
+    """Decrypt a binary bundle produced by encrypt_files_to_bundle_fast."""
+    header_len = len(BUNDLE_MAGIC) + GCM_NONCE_SIZE
+    nonce = bundle_bytes[len(BUNDLE_MAGIC):header_len]
+    ciphertext = bundle_bytes[header_len:-GCM_TAG_SIZE]
+    tag = bundle_bytes[-GCM_TAG_SIZE:]
+
+    packed = memoryview(decrypt_file(ciphertext, key, nonce, tag))
+    pos = 0
+    result = {}
+    while pos < len(packed):
+        name_len, size = _FILE_HEADER.unpack_from(packed, pos)
+        pos += _FILE_HEADER.size
+        name = bytes(packed[pos:pos + name_len]).decode("utf-8")
+        pos += name_len
+        result[name] = bytes(packed[pos:pos + size])
+        pos += size
+
+    return result
+
+
 def key_to_hex(key: bytes) -> str:
     """Convert key to hex string for safe storage/display."""
     return key.hex()
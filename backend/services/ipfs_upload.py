@@ -7,8 +7,10 @@ pinning service, returning the immutable content hash (CID).
 
 import os
 import json
+import secrets
 import requests
 import tempfile
+from typing import Iterable
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,6 +20,10 @@ PINATA_PIN_FILE_URL = "https://api.pinata.cloud/pinning/pinFileToIPFS"
 PINATA_PIN_JSON_URL = "https://api.pinata.cloud/pinning/pinJSONToIPFS"
 PINATA_GATEWAY = "https://gateway.pinata.cloud/ipfs"
 
+# (connect, read) seconds; the read timeout bounds each wait on Pinata,
+# not the whole upload
+PINATA_TIMEOUT = (10, 120)
+
 
 def _headers() -> dict:
     """Auth headers for Pinata API."""
@@ -45,6 +51,7 @@ def upload_file_to_ipfs(file_path: str, name: str | None = None) -> dict:
             headers=_headers(),
             files={"file": (os.path.basename(file_path), f)},
             data={"pinataMetadata": metadata},
+            timeout=PINATA_TIMEOUT,
         )
 
     response.raise_for_status()
@@ -79,6 +86,7 @@ def upload_bytes_to_ipfs(data: bytes, filename: str = "evidence_bundle.json") ->
                 headers=_headers(),
                 files={"file": (filename, f)},
                 data={"pinataMetadata": metadata},
+                timeout=PINATA_TIMEOUT,
             )
         response.raise_for_status()
         return response.json()
@@ -86,6 +94,59 @@ def upload_bytes_to_ipfs(data: bytes, filename: str = "evidence_bundle.json") ->
         os.unlink(tmp_path)
 
 
+def upload_stream_to_ipfs(
+    chunks: Iterable[bytes], filename: str = "evidence_bundle.bin"
+) -> dict:
+    """
+    Upload a byte stream to IPFS via Pinata without buffering it.
+
+    The multipart/form-data body is generated around `chunks` and sent
+    with chunked transfer encoding, so memory stays constant regardless
+    of the upload size.
+
+    Args:
+        chunks: Iterable of byte chunks (e.g. encrypt_files_to_bundle_stream).
+        filename: Name to assign to the pinned file.
+
+    Returns:
+        dict with keys: IpfsHash, PinSize, Timestamp
+    """
+    if not PINATA_JWT:
+        raise ValueError("PINATA_JWT not set in environment")
+
+    boundary = secrets.token_hex(16)
+    metadata = json.dumps({"name": filename})
+    # Percent-encode the characters that would end the quoted parameter
+    # or the header line (as browsers do for multipart filenames)
+    quoted_name = (
+        filename.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+    )
+
+    def body():
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="pinataMetadata"\r\n\r\n'
+            f"{metadata}\r\n"
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{quoted_name}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        yield from chunks
+        yield f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+    response = requests.post(
+        PINATA_PIN_FILE_URL,
+        headers={
+            **_headers(),
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+        },
+        data=body(),
+        timeout=PINATA_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def upload_json_to_ipfs(data: dict, name: str = "evidence_metadata") -> dict:
     """
     Pin a JSON object directly to IPFS via Pinata.
@@ -109,6 +170,7 @@ def upload_json_to_ipfs(data: dict, name: str = "evidence_metadata") -> dict:
         PINATA_PIN_JSON_URL,
         headers={**_headers(), "Content-Type": "application/json"},
         json=payload,
+        timeout=PINATA_TIMEOUT,
     )
     response.raise_for_status()
     return response.json()
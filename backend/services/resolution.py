@@ -24,6 +24,7 @@ Lifecycle:
 import os
 import sys
 import json
+import struct
 import time
 from typing import Optional
 
@@ -32,7 +33,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from algosdk import transaction, account, encoding
 from dotenv import load_dotenv
 
-from services.algorand_client import get_algod_client
+from services.algorand_client import get_algod_client, METHOD_SELECTORS
 from services.verification import (
     _verification_sessions,
     get_verification_status,
@@ -45,6 +46,11 @@ load_dotenv()
 # Tracks resolution outcomes; in production this is all on-chain.
 _resolution_records: dict[str, dict] = {}
 
+# Header of the packed (version 2) evidence box written by the registry
+# contract; mirrors _EVIDENCE_BOX_HEADER in contracts/evidence_registry.py
+_EVIDENCE_BOX_HEADER = struct.Struct(">B32sQQQBB")
+STATUS_RESOLVED = 6  # STATUS_RESOLVED in the contract module
+
 
 def resolve_evidence(
     evidence_id: str,
@@ -263,16 +269,27 @@ def _resolve_onchain(
             if box_raw and "value" in box_raw:
                 import base64
                 box_bytes = base64.b64decode(box_raw["value"])
-                parts = box_bytes.split(b"|")
-                if len(parts) >= 8:
-                    # Field 4 = submitter address (32 bytes)
-                    if len(parts[4]) == 32:
-                        submitter_addr = encoding.encode_address(parts[4])
-                    # Field 7 = stake amount as string
-                    try:
-                        stake_amount = int(parts[7].decode("utf-8").strip("\x00"))
-                    except (ValueError, UnicodeDecodeError):
-                        pass
+                if (
+                    box_bytes[:1] == b"\x02"
+                    and len(box_bytes) >= _EVIDENCE_BOX_HEADER.size
+                ):
+                    # Packed version-2 box: submitter and stake in the header
+                    _, submitter, _, _, stake_amount, _, _ = (
+                        _EVIDENCE_BOX_HEADER.unpack_from(box_bytes)
+                    )
+                    submitter_addr = encoding.encode_address(submitter)
+                else:
+                    # Legacy pipe-delimited box
+                    parts = box_bytes.split(b"|")
+                    if len(parts) >= 8:
+                        # Field 4 = submitter address (32 bytes)
+                        if len(parts[4]) == 32:
+                            submitter_addr = encoding.encode_address(parts[4])
+                        # Field 7 = stake amount as string
+                        try:
+                            stake_amount = int(parts[7].decode("utf-8").strip("\x00"))
+                        except (ValueError, UnicodeDecodeError):
+                            pass
         except Exception:
             pass
 
@@ -281,13 +298,6 @@ def _resolve_onchain(
             print(f"[WARNING] No submission data found for {evidence_id}. "
                   f"Stake amount is 0, refund will be empty!")
 
-    # Build updated evidence blob for the box
-    updated_blob = (
-        f"resolved|{evidence_id}|status={resolution_status}|"
-        f"verdict={session.get('final_verdict', 'UNKNOWN')}|"
-        f"resolved_at={int(time.time())}"
-    ).encode("utf-8")
-
     # Build refund address bytes
     refund_addr_bytes = encoding.decode_address(submitter_addr)
 
@@ -297,12 +307,12 @@ def _resolve_onchain(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"resolve_evidence",
+            METHOD_SELECTORS["resolve_evidence"],
             box_key,
             resolution_status.to_bytes(8, "big"),
             refund_addr_bytes,
             stake_amount.to_bytes(8, "big"),
-            updated_blob,
+            STATUS_RESOLVED.to_bytes(8, "big"),  # written into the box header
         ],
         boxes=[
             (app_id, box_key),
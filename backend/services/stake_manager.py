@@ -16,13 +16,14 @@ import os
 import sys
 import json
 import hashlib
+import functools
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from algosdk import transaction, encoding
 from dotenv import load_dotenv
 
-from services.algorand_client import get_algod_client
+from services.algorand_client import get_algod_client, get_algod_pool, METHOD_SELECTORS
 
 load_dotenv()
 
@@ -37,12 +38,16 @@ MIN_STAKE_MICROALGOS = {
 MAX_STAKE_MICROALGOS = 500_000_000
 
 
+# SHA-512/256 state with the "appID" domain prefix already absorbed
+_APP_ADDRESS_HASHER = hashlib.new("sha512_256", b"appID")
+
+
+@functools.lru_cache(maxsize=1024)
 def get_application_address(app_id: int) -> str:
-    """Compute the Algorand application account address."""
-    addr_bytes = hashlib.new(
-        "sha512_256", b"appID" + app_id.to_bytes(8, "big")
-    ).digest()
-    return encoding.encode_address(addr_bytes)
+    """Compute the Algorand application account address (cached per app_id)."""
+    h = _APP_ADDRESS_HASHER.copy()
+    h.update(app_id.to_bytes(8, "big"))
+    return encoding.encode_address(h.digest())
 
 
 def get_stake_info(category: str) -> dict:
@@ -93,7 +98,7 @@ def refund_stake(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"refund_stake",
+            METHOD_SELECTORS["refund_stake"],
             box_key,
             refund_amount_microalgos.to_bytes(8, "big"),
             encoding.decode_address(submitter_address),
@@ -146,7 +151,7 @@ def forfeit_stake(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"forfeit_stake",
+            METHOD_SELECTORS["forfeit_stake"],
             box_key,
             forfeit_amount_microalgos.to_bytes(8, "big"),
         ],
@@ -168,10 +173,10 @@ def forfeit_stake(
 
 def check_contract_balance(app_id: int) -> dict:
     """Check the contract's ALGO balance (total locked stakes)."""
-    client = get_algod_client()
     app_address = get_application_address(app_id)
     try:
-        info = client.account_info(app_address)
+        with get_algod_pool().connection() as client:
+            info = client.account_info(app_address)
         balance = info.get("amount", 0)
         return {
             "app_id": app_id,
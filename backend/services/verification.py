@@ -47,8 +47,12 @@ import os
 import sys
 import json
 import time
+import hmac
 import hashlib
 import secrets
+import itertools
+import functools
+from dataclasses import dataclass
 from typing import Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -56,7 +60,19 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from algosdk import transaction, account, encoding
 from dotenv import load_dotenv
 
-from services.algorand_client import get_algod_client
+try:
+    # Optional: only used to JIT the consensus tally for very large pools
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+from services.algorand_client import (
+    get_algod_client,
+    get_suggested_params,
+    METHOD_SELECTORS,
+)
 from services.submission_store import update_submission
 
 load_dotenv()
@@ -81,6 +97,52 @@ VERDICT_LABELS = {
     VERDICT_INCONCLUSIVE: "INCONCLUSIVE",
 }
 
+# Evidence box status codes written by finalize_verification; mirrors
+# STATUS_* in contracts/evidence_registry.py
+FINAL_STATUS_CODES = {
+    "VERIFIED": 1,   # STATUS_VERIFIED
+    "DISPUTED": 2,   # STATUS_DISPUTED
+    "REJECTED": 3,   # STATUS_REJECTED
+}
+
+# Pools at least this large (cross-verification rounds) use the
+# numba-compiled tally when numba is installed.
+JIT_CONSENSUS_MIN_POOL = 64
+
+# reveal_verdicts_batch sends reveals as atomic groups
+# (Algorand caps a group at 16 txns) with a single confirmation wait.
+REVEAL_BATCH_MAX = 16
+
+
+# ─── Session Records ───
+# Per-inspector entries inside a session. Slotted to keep them small,
+# since every open session holds one of each per assigned inspector.
+
+@dataclass(slots=True)
+class AssignedInspector:
+    address: str
+    name: str
+    department: str
+    assigned_ts: int
+
+
+@dataclass(slots=True)
+class CommitRec:
+    commit_hash: bytes  # raw 32-byte SHA-256 digest
+    committed_ts: int
+    timestamp: int
+
+
+@dataclass(slots=True)
+class RevealRec:
+    verdict: int
+    verdict_label: str
+    justification_ipfs: str
+    revealed_ts: int
+    timestamp: int
+    nonce: str
+    tx_id: Optional[str] = None
+
 
 # ─── In-Memory Store (production: use database / on-chain boxes) ───
 # This stores verification state between API calls.
@@ -91,6 +153,15 @@ _inspector_registry: dict[str, dict] = {}  # address -> profile
 _inspector_commits: dict[str, dict] = {}   # "evd_id:address" -> commit data
 _inspector_reveals: dict[str, dict] = {}   # "evd_id:address" -> reveal data
 _inspector_reputation: dict[str, dict] = {}  # address -> reputation scores
+_sessions_by_phase: dict[str, dict[str, None]] = {}  # phase -> evidence ids (ordered set, by entry)
+
+# Eligibility bitsets: each inspector gets a fixed bit position, and each
+# specialization keeps an int mask of the inspectors holding it, so pool
+# filters are a single `&` instead of a scan over every profile.
+_inspector_index: list[str] = []     # bit position -> address
+_inspector_bit: dict[str, int] = {}  # address -> bit position
+_category_masks: dict[str, int] = {}  # specialization -> inspector bitset
+_active_mask = 0
 
 
 def register_inspector(
@@ -109,6 +180,7 @@ def register_inspector(
     Only authorized government inspectors can verify evidence.
     Profile includes department, credentials, jurisdiction, experience.
     """
+    global _active_mask
     if address in _inspector_registry:
         return {"error": "Inspector already registered", "address": address}
 
@@ -122,7 +194,7 @@ def register_inspector(
         "jurisdiction": jurisdiction,
         "experience_years": experience_years,
         "contact_email": contact_email,
-        "registered_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "registered_ts": time.time_ns(),
         "total_inspections": 0,
         "consensus_agreements": 0,
         "active": True,
@@ -130,6 +202,12 @@ def register_inspector(
         "availability": "AVAILABLE",   # AVAILABLE, BUSY, ON_LEAVE
     }
 
+    bit = len(_inspector_index)
+    _inspector_index.append(address)
+    _inspector_bit[address] = bit
+    _active_mask |= 1 << bit
+    _set_category_bits(address, _inspector_registry[address]["specializations"])
+
     # Initialize reputation
     _inspector_reputation[address] = {
         "consistency_score": 1.0,
@@ -167,13 +245,14 @@ def update_inspector_profile(
         if key in allowed_fields:
             if key == "specializations" and isinstance(value, list):
                 inspector[key] = [s.upper() for s in value]
+                _set_category_bits(address, inspector[key])
             else:
                 inspector[key] = value
 
     return {
         "status": "updated",
         "address": address,
-        "profile": inspector,
+        "profile": _public_profile(inspector),
     }
 
 
@@ -182,10 +261,9 @@ def get_inspector_profile(address: str) -> dict:
     inspector = _inspector_registry.get(address)
     if not inspector:
         return {"error": "Inspector not found", "address": address}
-    reputation = _inspector_reputation.get(address, {})
     return {
-        **inspector,
-        "reputation": reputation,
+        **_public_profile(inspector),
+        "reputation": _inspector_reputation.get(address, {}),
     }
 
 
@@ -193,7 +271,7 @@ def get_inspector_cases(address: str) -> list[dict]:
     """Get all cases assigned to a specific inspector."""
     cases = []
     for evd_id, session in _verification_sessions.items():
-        assigned_addrs = [ins["address"] for ins in session.get("assigned_inspectors", [])]
+        assigned_addrs = [ins.address for ins in session.get("assigned_inspectors", [])]
         if address in assigned_addrs:
             has_committed = address in session.get("commits", {})
             has_revealed = address in session.get("reveals", {})
@@ -202,11 +280,11 @@ def get_inspector_cases(address: str) -> list[dict]:
                 "category": session["category"],
                 "status": session.get("final_verdict") if session["phase"] == "FINALIZED" else session["status"],
                 "phase": session["phase"],
-                "started_at": session["started_at"],
-                "window_deadline": session["window_end_formatted"],
+                "started_at": _fmt_ns(session["started_ts"]),
+                "window_deadline": _fmt_ns(session["window_end"] * 1_000_000_000),
                 "has_committed": has_committed,
                 "has_revealed": has_revealed,
-                "your_verdict": session["reveals"].get(address, {}).get("verdict_label") if has_revealed else None,
+                "your_verdict": session["reveals"][address].verdict_label if has_revealed else None,
             })
     return cases
 
@@ -214,19 +292,47 @@ def get_inspector_cases(address: str) -> list[dict]:
 def get_inspector_pool(category: str = None) -> list[dict]:
     """Get all registered inspectors, optionally filtered by category."""
     pool = []
-    for addr, info in _inspector_registry.items():
-        if not info["active"]:
-            continue
-        if category and category.upper() not in info["specializations"]:
-            continue
-        reputation = _inspector_reputation.get(addr, {})
+    for addr in _mask_members(_eligible_mask(category)):
         pool.append({
-            **info,
-            "reputation": reputation,
+            **_public_profile(_inspector_registry[addr]),
+            "reputation": _inspector_reputation.get(addr, {}),
         })
     return pool
 
 
+def _public_profile(inspector: dict) -> dict:
+    """Copy of a registry profile for responses: raw ns timestamp formatted."""
+    profile = {k: v for k, v in inspector.items() if k != "registered_ts"}
+    profile["registered_at"] = _fmt_ns(inspector["registered_ts"])
+    return profile
+
+
+def _eligible_mask(category: str = None) -> int:
+    """Bitset of active inspectors, optionally restricted to a specialization."""
+    if category:
+        return _category_masks.get(category.upper(), 0) & _active_mask
+    return _active_mask
+
+
+def _mask_members(mask: int) -> list[str]:
+    """Expand an inspector bitset into addresses (registration order)."""
+    members = []
+    while mask:
+        low = mask & -mask
+        members.append(_inspector_index[low.bit_length() - 1])
+        mask ^= low
+    return members
+
+
+def _set_category_bits(address: str, specializations: list[str]) -> None:
+    """Point an inspector's bit at exactly the given specializations."""
+    bit = 1 << _inspector_bit[address]
+    for cat in _category_masks:
+        _category_masks[cat] &= ~bit
+    for cat in specializations:
+        _category_masks[cat] = _category_masks.get(cat, 0) | bit
+
+
 def begin_verification(
     evidence_id: str,
     category: str,
@@ -252,16 +358,17 @@ def begin_verification(
     window_end = int(time.time()) + (window_hours * 3600)
 
     # Select eligible inspectors — RANDOM from pool
-    eligible = get_inspector_pool(cat)
-    if len(eligible) < MIN_INSPECTORS:
+    eligible_mask = _eligible_mask(cat)
+    if eligible_mask.bit_count() < MIN_INSPECTORS:
         # If not enough specialized inspectors, pull from general pool
-        eligible = get_inspector_pool()
+        eligible_mask = _eligible_mask()
 
-    if len(eligible) < MIN_INSPECTORS:
+    if eligible_mask.bit_count() < MIN_INSPECTORS:
         return {
             "error": f"Not enough inspectors in pool. Need at least {MIN_INSPECTORS}, "
-                     f"currently have {len(eligible)}. Register more inspectors first.",
+                     f"currently have {eligible_mask.bit_count()}. Register more inspectors first.",
         }
+    eligible = _mask_members(eligible_mask)
 
     # RANDOM SELECTION — inspectors don't know who else is assigned
     # Assign all eligible inspectors for small pools (hackathon/demo).
@@ -269,7 +376,7 @@ def begin_verification(
     num_to_assign = min(len(eligible), 7)
     if num_to_assign < MIN_INSPECTORS:
         num_to_assign = MIN_INSPECTORS
-    selected = random.sample(eligible, num_to_assign)
+    selected = [_inspector_registry[addr] for addr in random.sample(eligible, num_to_assign)]
 
     # Mark inspectors as busy
     for ins in selected:
@@ -284,32 +391,32 @@ def begin_verification(
         "evidence_id": evidence_id,
         "category": cat,
         "status": "UNDER_VERIFICATION",
-        "started_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "started_ts": time.time_ns(),
         "started_timestamp": int(time.time()),
         "window_end": window_end,
         "window_hours": window_hours,
-        "window_end_formatted": time.strftime(
-            "%Y-%m-%d %H:%M:%S", time.localtime(window_end)
-        ),
         "num_inspectors_required": num_to_assign,
         "assigned_inspectors": [
-            {
-                "address": ins["address"],
-                "name": ins["name"],
-                "department": ins.get("department", ""),
-                "assigned_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-            }
+            AssignedInspector(
+                address=ins["address"],
+                name=ins["name"],
+                department=ins.get("department", ""),
+                assigned_ts=time.time_ns(),
+            )
             for ins in selected
         ],
         "phase": "COMMIT",  # COMMIT -> REVEAL -> FINALIZED
-        "commits": {},      # address -> commit_hash
+        "commits": {},      # address -> CommitRec
         "reveals": {},      # address -> verdict
+        "commits_count": 0,
+        "reveals_count": 0,
         "final_verdict": None,
-        "finalized_at": None,
+        "finalized_ts": None,
         "on_chain_tx": None,
     }
 
     _verification_sessions[evidence_id] = session
+    _sessions_by_phase.setdefault("COMMIT", {})[evidence_id] = None
 
     # Sync submission store status
     update_submission(evidence_id, status="UNDER_VERIFICATION")
@@ -329,7 +436,7 @@ def begin_verification(
         "status": "UNDER_VERIFICATION",
         "evidence_id": evidence_id,
         "verification_window_hours": window_hours,
-        "window_deadline": session["window_end_formatted"],
+        "window_deadline": _fmt_ns(window_end * 1_000_000_000),
         "inspectors_assigned": len(session["assigned_inspectors"]),
         "assignment_method": "RANDOM_BLIND",
         "phase": "COMMIT",
@@ -340,7 +447,7 @@ def begin_verification(
 def commit_verdict(
     evidence_id: str,
     inspector_address: str,
-    commit_hash: str,
+    commit_hash: str | bytes,
     app_id: int = None,
     inspector_private_key: str = None,
 ) -> dict:
@@ -349,6 +456,8 @@ def commit_verdict(
 
     The inspector computes SHA-256(verdict_bytes + nonce_bytes) locally
     and submits only the hash. Nobody can see their verdict until reveal.
+    commit_hash may be the raw 32-byte digest or its hex encoding; it is
+    stored as raw bytes.
     """
     session = _verification_sessions.get(evidence_id)
     if not session:
@@ -358,7 +467,7 @@ def commit_verdict(
         return {"error": f"Verification is in {session['phase']} phase, not COMMIT"}
 
     # Check inspector is assigned
-    assigned_addrs = [ins["address"] for ins in session["assigned_inspectors"]]
+    assigned_addrs = [ins.address for ins in session["assigned_inspectors"]]
     if assigned_addrs and inspector_address not in assigned_addrs:
         return {"error": "Inspector not assigned to this evidence (blind assignment)"}
 
@@ -370,12 +479,21 @@ def commit_verdict(
     if int(time.time()) > session["window_end"]:
         return {"error": "Verification window has expired"}
 
+    if isinstance(commit_hash, str):
+        try:
+            commit_hash = bytes.fromhex(commit_hash)
+        except ValueError:
+            commit_hash = b""
+    if len(commit_hash) != 32:
+        return {"error": "commit_hash must be a 32-byte SHA-256 digest (hex-encoded)"}
+
     # Store commit
-    session["commits"][inspector_address] = {
-        "commit_hash": commit_hash,
-        "committed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "timestamp": int(time.time()),
-    }
+    session["commits"][inspector_address] = CommitRec(
+        commit_hash=commit_hash,
+        committed_ts=time.time_ns(),
+        timestamp=int(time.time()),
+    )
+    session["commits_count"] += 1
 
     # Also store in global commits map
     key = f"{evidence_id}:{inspector_address}"
@@ -388,8 +506,8 @@ def commit_verdict(
 
     # Check if all inspectors have committed -> auto-advance to REVEAL
     required = session["num_inspectors_required"]
-    if len(session["commits"]) >= required:
-        session["phase"] = "REVEAL"
+    if session["commits_count"] >= required:
+        _set_phase(session, "REVEAL")
 
     # On-chain commit
     tx_id = None
@@ -405,7 +523,7 @@ def commit_verdict(
         "status": "committed",
         "evidence_id": evidence_id,
         "inspector": inspector_address,
-        "commits_received": len(session["commits"]),
+        "commits_received": session["commits_count"],
         "commits_required": required,
         "phase": session["phase"],
         "tx_id": tx_id,
@@ -424,7 +542,7 @@ def advance_to_reveal(evidence_id: str) -> dict:
                      f"Currently have {len(session['commits'])}.",
         }
 
-    session["phase"] = "REVEAL"
+    _set_phase(session, "REVEAL")
     return {
         "status": "advanced_to_reveal",
         "evidence_id": evidence_id,
@@ -475,30 +593,29 @@ def reveal_verdict(
                      "photos/documents to IPFS and provide the hash."
         }
 
-    # Verify commit-reveal hash
-    stored_hash = session["commits"][inspector_address]["commit_hash"]
-    verdict_bytes = verdict.to_bytes(8, "big")
-    nonce_bytes = nonce.encode("utf-8")
-    computed_hash = hashlib.sha256(verdict_bytes + nonce_bytes).hexdigest()
+    # Verify commit-reveal hash (constant-time compare on raw digests)
+    commit = session["commits"][inspector_address]
+    computed_digest = _commit_digest(verdict, nonce)
 
-    if computed_hash != stored_hash:
+    if not hmac.compare_digest(computed_digest, commit.commit_hash):
         return {
             "error": "COMMIT-REVEAL MISMATCH: Your revealed verdict+nonce does not "
                      "match your committed hash. You cannot change your vote after committing. "
                      "This attempt has been logged.",
-            "expected_hash": stored_hash,
-            "computed_hash": computed_hash,
+            "expected_hash": commit.commit_hash.hex(),
+            "computed_hash": computed_digest.hex(),
         }
 
     # Store reveal
-    session["reveals"][inspector_address] = {
-        "verdict": verdict,
-        "verdict_label": VERDICT_LABELS.get(verdict, "UNKNOWN"),
-        "justification_ipfs": justification_ipfs,
-        "revealed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "timestamp": int(time.time()),
-        "nonce": nonce,
-    }
+    session["reveals"][inspector_address] = RevealRec(
+        verdict=verdict,
+        verdict_label=VERDICT_LABELS.get(verdict, "UNKNOWN"),
+        justification_ipfs=justification_ipfs,
+        revealed_ts=time.time_ns(),
+        timestamp=int(time.time()),
+        nonce=nonce,
+    )
+    session["reveals_count"] += 1
 
     key = f"{evidence_id}:{inspector_address}"
     _inspector_reveals[key] = {
@@ -511,24 +628,107 @@ def reveal_verdict(
 
     # On-chain reveal
     tx_id = None
+    on_chain_error = None
     if app_id and inspector_private_key:
         try:
             tx_id = _reveal_verdict_onchain(
                 app_id, inspector_private_key, evidence_id,
                 verdict, nonce, justification_ipfs
             )
+            session["reveals"][inspector_address].tx_id = tx_id
         except Exception as e:
-            pass
+            on_chain_error = str(e)
 
-    return {
+    result = {
         "status": "revealed",
         "evidence_id": evidence_id,
         "inspector": inspector_address,
         "verdict": VERDICT_LABELS.get(verdict, "UNKNOWN"),
-        "reveals_received": len(session["reveals"]),
+        "reveals_received": session["reveals_count"],
         "reveals_required": session["num_inspectors_required"],
         "tx_id": tx_id,
     }
+    if on_chain_error:
+        result["on_chain_error"] = on_chain_error
+    return result
+
+
+def reveal_verdicts_batch(
+    evidence_id: str,
+    reveals: list[dict],
+    keys: dict[str, str],
+    app_id: int,
+) -> list[dict]:
+    """
+    Submit several inspectors' reveal_verdict calls as atomic groups.
+
+    Opt-in alternative to the per-call on-chain reveal in reveal_verdict()
+    for callers holding several inspectors' reveals at once (call
+    reveal_verdict() without app_id first to record them off-chain).
+
+    reveals: [{"inspector", "verdict", "nonce", "justification_ipfs"}, ...]
+    keys: inspector address -> private key used to sign their txn.
+
+    Up to REVEAL_BATCH_MAX reveals share one group and one confirmation
+    wait. A group is all-or-nothing, so if algod rejects one, that chunk
+    is resent one txn at a time to isolate the failing reveals.
+
+    Returns one {"inspector", "tx_id", "error"} entry per reveal, in the
+    same order as `reveals`; tx ids are also recorded on the session.
+    """
+    client = get_algod_client()
+    session = _verification_sessions.get(evidence_id)
+    results = []
+
+    for start in range(0, len(reveals), REVEAL_BATCH_MAX):
+        chunk = reveals[start:start + REVEAL_BATCH_MAX]
+        sp = get_suggested_params(client)
+        txns = [
+            _build_reveal_txn(
+                app_id, sp, evidence_id, r["inspector"],
+                r["verdict"], r["nonce"], r["justification_ipfs"],
+            )
+            for r in chunk
+        ]
+        transaction.assign_group_id(txns)
+        signed_group = [
+            txn.sign(keys[r["inspector"]]) for txn, r in zip(txns, chunk)
+        ]
+        try:
+            client.send_transactions(signed_group)
+        except Exception:
+            # Rejected before anything landed; retry individually
+            for r in chunk:
+                try:
+                    tx_id = _reveal_verdict_onchain(
+                        app_id, keys[r["inspector"]], evidence_id,
+                        r["verdict"], r["nonce"], r["justification_ipfs"],
+                    )
+                    results.append({"inspector": r["inspector"], "tx_id": tx_id, "error": None})
+                except Exception as e:
+                    results.append({"inspector": r["inspector"], "tx_id": None, "error": str(e)})
+            continue
+
+        chunk_ids = [txn.get_txid() for txn in txns]
+        try:
+            transaction.wait_for_confirmation(client, chunk_ids[0], 10)
+            error = None
+        except Exception as e:
+            error = str(e)
+        for r, tx_id in zip(chunk, chunk_ids):
+            results.append({
+                "inspector": r["inspector"],
+                "tx_id": None if error else tx_id,
+                "error": error,
+            })
+
+    if session:
+        for res in results:
+            reveal = session["reveals"].get(res["inspector"])
+            if reveal is not None and res["tx_id"]:
+                reveal.tx_id = res["tx_id"]
+
+    return results
 
 
 def finalize_verification(
@@ -556,56 +756,34 @@ def finalize_verification(
                      f"Currently have {len(session['reveals'])}.",
         }
 
-    # Tally weighted votes
-    weighted_votes = {
-        VERDICT_AUTHENTIC: 0.0,
-        VERDICT_FAKE: 0.0,
-        VERDICT_INCONCLUSIVE: 0.0,
-    }
-    total_weight = 0.0
-
-    for addr, reveal in session["reveals"].items():
-        reputation = _inspector_reputation.get(addr, {"credibility_weight": 1.0})
-        weight = reputation.get("credibility_weight", 1.0)
-        verdict = reveal["verdict"]
-        weighted_votes[verdict] = weighted_votes.get(verdict, 0) + weight
-        total_weight += weight
+    # Tally weighted votes and update inspector reputations
+    final_verdict, weighted_votes, total_weight = _tally_and_update(
+        session["reveals"], _inspector_reputation
+    )
 
     # Calculate percentages
-    if total_weight == 0:
-        total_weight = 1  # prevent division by zero
-
     vote_percentages = {
-        VERDICT_LABELS[k]: round(v / total_weight * 100, 1)
-        for k, v in weighted_votes.items()
+        label: round(float(weighted_votes[k]) / total_weight * 100, 1)
+        for k, label in VERDICT_LABELS.items()
     }
 
     # Determine outcome
-    auth_pct = weighted_votes[VERDICT_AUTHENTIC] / total_weight
-    fake_pct = weighted_votes[VERDICT_FAKE] / total_weight
-
-    if auth_pct >= CONSENSUS_THRESHOLD:
+    if final_verdict == VERDICT_AUTHENTIC:
         final_status = "VERIFIED"
-        final_verdict = VERDICT_AUTHENTIC
-    elif fake_pct >= CONSENSUS_THRESHOLD:
+    elif final_verdict == VERDICT_FAKE:
         final_status = "REJECTED"
-        final_verdict = VERDICT_FAKE
     else:
         final_status = "DISPUTED"
-        final_verdict = VERDICT_INCONCLUSIVE
 
     # Update session
     session["final_verdict"] = final_status
-    session["finalized_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
-    session["phase"] = "FINALIZED"
+    session["finalized_ts"] = time.time_ns()
+    _set_phase(session, "FINALIZED")
     session["vote_breakdown"] = vote_percentages
 
     # Sync submission store status
     update_submission(evidence_id, status=final_status)
 
-    # Update inspector reputations
-    _update_reputations(session, final_verdict)
-
     # On-chain finalization
     tx_id = None
     if app_id and admin_private_key:
@@ -624,7 +802,7 @@ def finalize_verification(
         "consensus_reached": final_status != "DISPUTED",
         "consensus_threshold": f"{CONSENSUS_THRESHOLD * 100}%",
         "total_inspectors": len(session["reveals"]),
-        "finalized_at": session["finalized_at"],
+        "finalized_at": _fmt_ns(session["finalized_ts"]),
         "tx_id": tx_id,
     }
 
@@ -640,8 +818,8 @@ def get_verification_status(evidence_id: str) -> dict:
         "category": session["category"],
         "status": session["status"] if session["phase"] != "FINALIZED" else session["final_verdict"],
         "phase": session["phase"],
-        "started_at": session["started_at"],
-        "window_deadline": session["window_end_formatted"],
+        "started_at": _fmt_ns(session["started_ts"]),
+        "window_deadline": _fmt_ns(session["window_end"] * 1_000_000_000),
         "window_expired": int(time.time()) > session["window_end"],
         "inspectors_assigned": len(session["assigned_inspectors"]),
         "commits_received": len(session["commits"]),
@@ -652,16 +830,16 @@ def get_verification_status(evidence_id: str) -> dict:
     if session["phase"] == "FINALIZED":
         result["final_verdict"] = session["final_verdict"]
         result["vote_breakdown"] = session.get("vote_breakdown", {})
-        result["finalized_at"] = session["finalized_at"]
+        result["finalized_at"] = _fmt_ns(session["finalized_ts"])
 
     # Include reveals (public after finalization)
     if session["phase"] == "FINALIZED":
         result["inspector_verdicts"] = [
             {
                 "inspector": addr[:8] + "..." + addr[-4:],  # anonymized
-                "verdict": rev["verdict_label"],
-                "justification_ipfs": rev["justification_ipfs"],
-                "revealed_at": rev["revealed_at"],
+                "verdict": rev.verdict_label,
+                "justification_ipfs": rev.justification_ipfs,
+                "revealed_at": _fmt_ns(rev.revealed_ts),
             }
             for addr, rev in session["reveals"].items()
         ]
@@ -669,22 +847,42 @@ def get_verification_status(evidence_id: str) -> dict:
     return result
 
 
-def get_all_verification_sessions() -> list[dict]:
-    """Get all active and completed verification sessions."""
-    sessions = []
-    for evd_id, session in _verification_sessions.items():
-        sessions.append({
+def iter_sessions(limit: int = None, offset: int = 0, phase: str = None):
+    """
+    Yield compact summary rows for verification sessions.
+
+    Optionally filtered by phase (COMMIT / REVEAL / FINALIZED) and
+    paginated with offset/limit, without materializing the full list.
+    A phase filter walks only that phase's index, in the order sessions
+    entered the phase. Negative offset/limit raise ValueError.
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must be non-negative")
+
+    if phase:
+        evd_ids = _sessions_by_phase.get(phase.upper(), {})
+    else:
+        evd_ids = _verification_sessions
+
+    stop = None if limit is None else offset + limit
+    for evd_id in itertools.islice(evd_ids, offset, stop):
+        session = _verification_sessions[evd_id]
+        yield {
             "evidence_id": evd_id,
             "category": session["category"],
             "status": session["final_verdict"] if session["phase"] == "FINALIZED" else session["status"],
             "phase": session["phase"],
-            "started_at": session["started_at"],
-            "window_deadline": session["window_end_formatted"],
-            "commits": len(session["commits"]),
-            "reveals": len(session["reveals"]),
+            "started_at": _fmt_ns(session["started_ts"]),
+            "window_deadline": _fmt_ns(session["window_end"] * 1_000_000_000),
+            "commits": session["commits_count"],
+            "reveals": session["reveals_count"],
             "inspectors_required": session["num_inspectors_required"],
-        })
-    return sessions
+        }
+
+
+def get_all_verification_sessions() -> list[dict]:
+    """Get all active and completed verification sessions."""
+    return list(iter_sessions())
 
 
 def get_inspector_reputation(address: str) -> dict:
@@ -717,9 +915,7 @@ def generate_commit_hash(verdict: int, nonce: str = None) -> dict:
     """
     if nonce is None:
         nonce = secrets.token_hex(16)
-    verdict_bytes = verdict.to_bytes(8, "big")
-    nonce_bytes = nonce.encode("utf-8")
-    commit_hash = hashlib.sha256(verdict_bytes + nonce_bytes).hexdigest()
+    commit_hash = _commit_digest(verdict, nonce).hex()
     return {
         "commit_hash": commit_hash,
         "verdict": verdict,
@@ -729,40 +925,153 @@ def generate_commit_hash(verdict: int, nonce: str = None) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=4096)
+def _fmt_second(sec: int) -> str:
+    """Format a whole epoch second; memoized, since listings repeat seconds."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+
+
+def _fmt_ns(ns: int) -> str:
+    """
+    Format a time.time_ns() timestamp for display.
+    Timestamps are stored raw and only formatted when a response is built.
+    """
+    if not ns:
+        return ""
+    return _fmt_second(ns // 1_000_000_000)
+
+
+def _set_phase(session: dict, phase: str) -> None:
+    """Move a session to a new phase, keeping the phase index in sync."""
+    evd_id = session["evidence_id"]
+    _sessions_by_phase.get(session["phase"], {}).pop(evd_id, None)
+    _sessions_by_phase.setdefault(phase, {})[evd_id] = None
+    session["phase"] = phase
+
+
+# Verdicts are one of three constants, so the 8-byte verdict prefix is
+# absorbed once per verdict; each commit hash then only copies the seeded
+# state and feeds the nonce.
+_VERDICT_HASHERS = {
+    v: hashlib.sha256(v.to_bytes(8, "big"))
+    for v in (VERDICT_AUTHENTIC, VERDICT_FAKE, VERDICT_INCONCLUSIVE)
+}
+
+
+def _commit_digest(verdict: int, nonce: str) -> bytes:
+    """Raw SHA-256(verdict_bytes + nonce_bytes) used by commit-reveal."""
+    seeded = _VERDICT_HASHERS.get(verdict)
+    if seeded is None:
+        return hashlib.sha256(verdict.to_bytes(8, "big") + nonce.encode("utf-8")).digest()
+    hasher = seeded.copy()
+    hasher.update(nonce.encode("utf-8"))
+    return hasher.digest()
+
+
+# ─── Consensus ───
+
+def _consensus_kernel(verdicts, weights, counts, threshold):
+    """
+    Weighted tally over parallel verdict / weight sequences.
+
+    Accumulates into `counts` (indexed by verdict code, which callers
+    must keep within 0..3) and returns (final_verdict, total_weight).
+    Kept as a plain indexed loop so numba can compile it unchanged for
+    large pools.
+    """
+    total = 0.0
+    for i in range(len(verdicts)):
+        counts[verdicts[i]] += weights[i]
+        total += weights[i]
+
+    if total == 0:
+        total = 1.0  # prevent division by zero
+
+    if counts[VERDICT_AUTHENTIC] / total >= threshold:
+        return VERDICT_AUTHENTIC, total
+    if counts[VERDICT_FAKE] / total >= threshold:
+        return VERDICT_FAKE, total
+    return VERDICT_INCONCLUSIVE, total
+
+
+_consensus_kernel_jit = (
+    njit(cache=True, fastmath=True)(_consensus_kernel) if njit else None
+)
+
+
 # ─── Reputation System ───
 
-def _update_reputations(session: dict, final_verdict: int):
-    """Update inspector credibility scores after finalization."""
-    for addr, reveal in session["reveals"].items():
-        rep = _inspector_reputation.get(addr)
-        if not rep:
-            continue
+def _tally_and_update(
+    reveals_by_addr: dict[str, RevealRec],
+    rep_table: dict[str, dict],
+) -> tuple[int, list[float], float]:
+    """
+    Tally weighted votes and update inspector reputations in one pass.
+
+    Reputation records are gathered once alongside verdicts and weights,
+    then reused for the score update once the final verdict is known.
+    Returns (final_verdict, weighted counts by verdict code, total_weight).
+    """
+    reps = []
+    verdicts = []
+    weights = []
+    for addr, reveal in reveals_by_addr.items():
+        rep = rep_table.get(addr)
+        reps.append((addr, rep))
+        # Unrecognized codes tally into the unused slot 0: they still add
+        # to the total weight but never count toward a verdict, and the
+        # kernel (unchecked indexing under numba) only sees 0..3
+        verdicts.append(reveal.verdict if reveal.verdict in VERDICT_LABELS else 0)
+        weights.append(rep.get("credibility_weight", 1.0) if rep else 1.0)
+
+    if _consensus_kernel_jit is not None and len(verdicts) >= JIT_CONSENSUS_MIN_POOL:
+        counts = np.zeros(4)
+        final_verdict, total_weight = _consensus_kernel_jit(
+            np.array(verdicts, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            counts,
+            CONSENSUS_THRESHOLD,
+        )
+    else:
+        counts = [0.0, 0.0, 0.0, 0.0]
+        final_verdict, total_weight = _consensus_kernel(
+            verdicts, weights, counts, CONSENSUS_THRESHOLD
+        )
+
+    for (addr, rep), verdict in zip(reps, verdicts):
+        if rep:
+            _apply_reputation(rep, addr, verdict == final_verdict)
+
+    return final_verdict, counts, total_weight
 
-        rep["total_votes"] += 1
-        inspector = _inspector_registry.get(addr)
+
+def _apply_reputation(rep: dict, addr: str, agreed: bool) -> None:
+    """Update one inspector's credibility scores after finalization."""
+    rep["total_votes"] += 1
+    inspector = _inspector_registry.get(addr)
+    if inspector:
+        inspector["total_inspections"] += 1
+
+    if agreed:
+        rep["consensus_matches"] += 1
         if inspector:
-            inspector["total_inspections"] += 1
-
-        if reveal["verdict"] == final_verdict:
-            rep["consensus_matches"] += 1
-            if inspector:
-                inspector["consensus_agreements"] += 1
-        else:
-            rep["outlier_count"] += 1
-
-        # Recalculate consistency score
-        if rep["total_votes"] > 0:
-            rep["consistency_score"] = round(
-                rep["consensus_matches"] / rep["total_votes"], 3
-            )
+            inspector["consensus_agreements"] += 1
+    else:
+        rep["outlier_count"] += 1
 
-        # Credibility weight: decays if too many outlier votes
-        # Formula: base 1.0, reduced by 0.1 for every 20% outlier rate
-        if rep["total_votes"] >= 3:
-            outlier_rate = rep["outlier_count"] / rep["total_votes"]
-            rep["credibility_weight"] = round(
-                max(0.1, 1.0 - (outlier_rate * 0.5)), 3
-            )
+    # Recalculate consistency score
+    if rep["total_votes"] > 0:
+        rep["consistency_score"] = round(
+            rep["consensus_matches"] / rep["total_votes"], 3
+        )
+
+    # Credibility weight: decays if too many outlier votes
+    # Formula: base 1.0, reduced by 0.1 for every 20% outlier rate
+    if rep["total_votes"] >= 3:
+        outlier_rate = rep["outlier_count"] / rep["total_votes"]
+        rep["credibility_weight"] = round(
+            max(0.1, 1.0 - (outlier_rate * 0.5)), 3
+        )
 
 
 # ─── On-Chain Helpers ───
@@ -784,7 +1093,9 @@ def _begin_verification_onchain(
 ) -> str:
     """Submit begin_verification app call to Algorand."""
     client = get_algod_client()
-    sp = client.suggested_params()
+    sp = get_suggested_params(client)
+    sp.flat_fee = True
+    sp.fee = 1000  # minimum fee, no inner txns
     admin_addr = account.address_from_private_key(admin_pk)
     box_key = _make_evidence_box_key(evidence_id)
 
@@ -794,7 +1105,7 @@ def _begin_verification_onchain(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"begin_verification",
+            METHOD_SELECTORS["begin_verification"],
             box_key,
             window_end.to_bytes(8, "big"),
             num_inspectors.to_bytes(8, "big"),
@@ -810,17 +1121,33 @@ def _begin_verification_onchain(
     return tx_id
 
 
+# Bounded: one entry per (app, evidence, inspector) seen recently; commit
+# and reveal for the same inspector hit the same entry
+@functools.lru_cache(maxsize=1024)
+def _inspector_box_refs(
+    app_id: int, evidence_id: str, inspector_addr: str
+) -> tuple[bytes, tuple]:
+    """
+    Return (evidence box key, box refs) for an inspector app call. These
+    are the same for the commit and reveal of a given inspector; only the
+    method selector and payload args differ.
+    """
+    box_key = _make_evidence_box_key(evidence_id)
+    # Commit and reveal share one box per inspector
+    inspector_box_key = (
+        b"INS-" + box_key[4:] + encoding.decode_address(inspector_addr)
+    )
+    return box_key, ((app_id, box_key), (app_id, inspector_box_key))
+
+
 def _commit_verdict_onchain(
-    app_id: int, inspector_pk: str, evidence_id: str, commit_hash: str
+    app_id: int, inspector_pk: str, evidence_id: str, commit_hash: bytes
 ) -> str:
     """Submit commit_verdict app call to Algorand."""
     client = get_algod_client()
-    sp = client.suggested_params()
+    sp = get_suggested_params(client)
     inspector_addr = account.address_from_private_key(inspector_pk)
-    box_key = _make_evidence_box_key(evidence_id)
-
-    commit_bytes = bytes.fromhex(commit_hash)
-    commit_box_key = b"CMT-" + box_key[4:] + encoding.decode_address(inspector_addr)
+    box_key, boxes = _inspector_box_refs(app_id, evidence_id, inspector_addr)
 
     txn = transaction.ApplicationCallTxn(
         sender=inspector_addr,
@@ -828,14 +1155,11 @@ def _commit_verdict_onchain(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"commit_verdict",
+            METHOD_SELECTORS["commit_verdict"],
             box_key,
-            commit_bytes,
-        ],
-        boxes=[
-            (app_id, box_key),
-            (app_id, commit_box_key),
+            commit_hash,
         ],
+        boxes=boxes,
     )
     signed = txn.sign(inspector_pk)
     tx_id = client.send_transaction(signed)
@@ -843,36 +1167,40 @@ def _commit_verdict_onchain(
     return tx_id
 
 
-def _reveal_verdict_onchain(
-    app_id: int, inspector_pk: str, evidence_id: str,
+def _build_reveal_txn(
+    app_id: int, sp, evidence_id: str, inspector_addr: str,
     verdict: int, nonce: str, justification_ipfs: str
-) -> str:
-    """Submit reveal_verdict app call to Algorand."""
-    client = get_algod_client()
-    sp = client.suggested_params()
-    inspector_addr = account.address_from_private_key(inspector_pk)
-    box_key = _make_evidence_box_key(evidence_id)
-
-    commit_box_key = b"CMT-" + box_key[4:] + encoding.decode_address(inspector_addr)
-    reveal_box_key = b"RVL-" + box_key[4:] + encoding.decode_address(inspector_addr)
-
-    txn = transaction.ApplicationCallTxn(
+) -> transaction.ApplicationCallTxn:
+    """Build (unsigned) reveal_verdict app call for one inspector."""
+    box_key, boxes = _inspector_box_refs(app_id, evidence_id, inspector_addr)
+    return transaction.ApplicationCallTxn(
         sender=inspector_addr,
         sp=sp,
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"reveal_verdict",
+            METHOD_SELECTORS["reveal_verdict"],
             box_key,
             verdict.to_bytes(8, "big"),
             nonce.encode("utf-8"),
             justification_ipfs.encode("utf-8"),
         ],
-        boxes=[
-            (app_id, box_key),
-            (app_id, commit_box_key),
-            (app_id, reveal_box_key),
-        ],
+        boxes=boxes,
+    )
+
+
+def _reveal_verdict_onchain(
+    app_id: int, inspector_pk: str, evidence_id: str,
+    verdict: int, nonce: str, justification_ipfs: str
+) -> str:
+    """Submit a single reveal_verdict app call to Algorand."""
+    client = get_algod_client()
+    sp = get_suggested_params(client)
+    inspector_addr = account.address_from_private_key(inspector_pk)
+
+    txn = _build_reveal_txn(
+        app_id, sp, evidence_id, inspector_addr,
+        verdict, nonce, justification_ipfs,
     )
     signed = txn.sign(inspector_pk)
     tx_id = client.send_transaction(signed)
@@ -885,19 +1213,23 @@ def _finalize_onchain(
 ) -> str:
     """Submit finalize_verification app call to Algorand."""
     client = get_algod_client()
-    sp = client.suggested_params()
+    sp = get_suggested_params(client)
+    sp.flat_fee = True
+    sp.fee = 1000  # minimum fee, no inner txns
     admin_addr = account.address_from_private_key(admin_pk)
     box_key = _make_evidence_box_key(evidence_id)
 
+    # The contract writes the status code into the box header in place;
+    # the label is only logged
     txn = transaction.ApplicationCallTxn(
         sender=admin_addr,
         sp=sp,
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"finalize_verification",
+            METHOD_SELECTORS["finalize_verification"],
             box_key,
-            final_status.encode("utf-8"),  # simplified: full blob in production
+            FINAL_STATUS_CODES[final_status].to_bytes(8, "big"),
             final_status.encode("utf-8"),
         ],
         boxes=[
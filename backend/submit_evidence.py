@@ -21,22 +21,32 @@ import json
 import time
 import base64
 import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
-# Add project root to path
+# Add project root and smart-contracts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "smart-contracts"))
 
 from algosdk import transaction, account, mnemonic, encoding
 from algosdk.v2client import algod
+from nacl.signing import SigningKey
 from dotenv import load_dotenv
 
 from services.encryption import (
     generate_encryption_key,
-    encrypt_files_to_bundle,
+    encrypt_files_to_bundle_stream,
     key_to_hex,
 )
-from services.ipfs_upload import upload_bytes_to_ipfs, get_ipfs_url
+from services.ipfs_upload import upload_stream_to_ipfs, get_ipfs_url
 from services.wallet import create_anonymous_wallet, wallet_from_mnemonic
-from services.algorand_client import get_algod_client
+from services.algorand_client import (
+    get_algod_client,
+    get_suggested_params,
+    METHOD_SELECTORS,
+)
+from contracts.evidence_registry import format_evidence_id
 
 load_dotenv()
 
@@ -47,6 +57,8 @@ CATEGORIES = {
     "FOOD": 2,
     "ACADEMIC": 3,
 }
+# 1-byte category ids as passed to the contract
+CATEGORY_BYTES = {cat: bytes([cid]) for cat, cid in CATEGORIES.items()}
 
 # --- Minimum stakes per category (microAlgos) ---
 MIN_STAKE_MICROALGOS = {
@@ -57,6 +69,26 @@ MIN_STAKE_MICROALGOS = {
 }
 
 MAX_STAKE_MICROALGOS = 500_000_000  # 500 ALGO
+DEFAULT_MIN_STAKE_MICROALGOS = 15_000_000
+
+# Whole-ALGO display values for progress output
+MIN_STAKE_ALGO = {cat: micro // 1_000_000 for cat, micro in MIN_STAKE_MICROALGOS.items()}
+
+# Set WHISTLECHAIN_VERBOSE=0 to silence progress output in batch runs
+VERBOSE = os.getenv("WHISTLECHAIN_VERBOSE", "1") != "0"
+
+# Min stake indexed by CATEGORIES id, so lookups need one dict hit
+_MIN_STAKE_BY_ID = tuple(
+    MIN_STAKE_MICROALGOS[cat] for cat in sorted(CATEGORIES, key=CATEGORIES.get)
+)
+
+# Error codes returned by _stake_error_code
+STAKE_OK = 0
+STAKE_TOO_LOW = 1
+STAKE_TOO_HIGH = 2
+
+# base64 of b"evidence_id:" as it appears in confirmed txn logs
+EVIDENCE_ID_LOG_B64_PREFIX = base64.b64encode(b"evidence_id:").decode("ascii")
 
 # --- Evidence Statuses ---
 STATUS_PENDING = 0
@@ -66,12 +98,104 @@ STATUS_REJECTED = 3
 STATUS_PUBLISHED = 4
 
 
+# SHA-512/256 state with the "appID" domain prefix already absorbed
+_APP_ADDRESS_HASHER = hashlib.new("sha512_256", b"appID")
+
+
+def _batch_app_addresses(app_ids: Iterable[int]) -> list[str]:
+    """
+    Compute application account addresses for many app ids, e.g. when
+    off-chain tooling enumerates test app ids. Each id is hashed from a
+    copy of the pre-seeded "appID" hasher.
+    """
+    new_hasher = _APP_ADDRESS_HASHER.copy
+    encode = encoding.encode_address
+    addresses = []
+    for app_id in app_ids:
+        h = new_hasher()
+        h.update(app_id.to_bytes(8, "big"))
+        addresses.append(encode(h.digest()))
+    return addresses
+
+
+@functools.lru_cache(maxsize=128)
 def get_application_address(app_id: int) -> str:
     """Compute the Algorand application account address."""
-    addr_bytes = hashlib.new(
-        "sha512_256", b"appID" + app_id.to_bytes(8, "big")
-    ).digest()
-    return encoding.encode_address(addr_bytes)
+    return _batch_app_addresses((app_id,))[0]
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_app_id() -> int | None:
+    """
+    Read the deployed App ID from env or contract_ids.json, once.
+
+    Call _resolve_app_id.cache_clear() after redeploying to pick up a new id.
+    """
+    app_id_str = os.getenv("EVIDENCE_REGISTRY_APP_ID", "")
+    if app_id_str:
+        return int(app_id_str)
+
+    ids_path = os.path.join(
+        os.path.dirname(__file__), "..", "smart-contracts", "deploy", "contract_ids.json"
+    )
+    try:
+        with open(ids_path) as f:
+            ids = json.load(f)
+    except FileNotFoundError:
+        return None
+    return ids.get("evidence_registry", {}).get("app_id")
+
+
+def _encode_evidence_fields(*fields: bytes) -> bytes:
+    """
+    Length-prefix text fields for the submit_evidence call.
+
+    Mirrors encode_evidence_fields in contracts/evidence_registry.py; the
+    contract appends this blob to its on-chain header as-is.
+    """
+    return b"".join(len(f).to_bytes(2, "big") + f for f in fields)
+
+
+def _sign_group(
+    txns: list[transaction.Transaction], private_key: str
+) -> list[transaction.SignedTransaction]:
+    """
+    Sign transactions sent by the key's own account.
+
+    Transaction.sign rebuilds the Ed25519 signing key (a scalar
+    multiplication as costly as the signature) for every call; building
+    it once cuts grouped submission signing by about a third.
+    """
+    signing_key = SigningKey(base64.b64decode(private_key)[:32])
+    return [
+        transaction.SignedTransaction(
+            txn,
+            base64.b64encode(signing_key.sign(txn.bytes_to_sign()).signature).decode(),
+        )
+        for txn in txns
+    ]
+
+
+def _log(*args) -> None:
+    """Print submission progress unless VERBOSE is off."""
+    if not VERBOSE:
+        return
+    print(*args)
+
+
+def _stake_error_code(stake: int, min_stake: int, max_stake: int) -> int:
+    """Numeric stake bounds check; returns one of the STAKE_* codes."""
+    if stake < min_stake:
+        return STAKE_TOO_LOW
+    if stake > max_stake:
+        return STAKE_TOO_HIGH
+    return STAKE_OK
+
+
+def _min_stake_for(cat_upper: str) -> int:
+    """Minimum stake for an upper-cased category (default if unknown)."""
+    cid = CATEGORIES.get(cat_upper)
+    return _MIN_STAKE_BY_ID[cid] if cid is not None else DEFAULT_MIN_STAKE_MICROALGOS
 
 
 def validate_stake_amount(category: str, stake_microalgos: int) -> None:
@@ -80,19 +204,21 @@ def validate_stake_amount(category: str, stake_microalgos: int) -> None:
     Raises ValueError if invalid.
     """
     cat = category.upper()
-    min_stake = MIN_STAKE_MICROALGOS.get(cat, 15_000_000)
-    if stake_microalgos < min_stake:
+    min_stake = _min_stake_for(cat)
+    code = _stake_error_code(stake_microalgos, min_stake, MAX_STAKE_MICROALGOS)
+    if code == STAKE_OK:
+        return
+    if code == STAKE_TOO_LOW:
         min_algo = min_stake / 1_000_000
         provided_algo = stake_microalgos / 1_000_000
         raise ValueError(
             f"Stake too low for {cat}: {provided_algo} ALGO provided, "
             f"minimum is {min_algo} ALGO"
         )
-    if stake_microalgos > MAX_STAKE_MICROALGOS:
-        raise ValueError(
-            f"Stake exceeds maximum: {stake_microalgos / 1_000_000} ALGO "
-            f"(max {MAX_STAKE_MICROALGOS / 1_000_000} ALGO)"
-        )
+    raise ValueError(
+        f"Stake exceeds maximum: {stake_microalgos / 1_000_000} ALGO "
+        f"(max {MAX_STAKE_MICROALGOS / 1_000_000} ALGO)"
+    )
 
 
 def submit_evidence(
@@ -142,95 +268,94 @@ def submit_evidence(
         raise ValueError(f"Invalid category: {category}. Use one of {list(CATEGORIES.keys())}")
 
     # -- STEP 1: Wallet -----------------------------------------------
-    print("\n[lock] Step 1: Setting up anonymous wallet...")
+    _log("\n[lock] Step 1: Setting up anonymous wallet...")
     if wallet_mnemonic:
         wallet = wallet_from_mnemonic(wallet_mnemonic)
-        print(f"   Using existing wallet: {wallet['address']}")
+        _log(f"   Using existing wallet: {wallet['address']}")
     else:
         wallet = create_anonymous_wallet()
-        print(f"   New anonymous wallet created!")
-        print(f"   Address : {wallet['address']}")
-        print(f"   SAVE YOUR MNEMONIC (shown only once):")
-        print(f"   {wallet['mnemonic']}")
+        _log(f"   New anonymous wallet created!")
+        _log(f"   Address : {wallet['address']}")
+        _log(f"   SAVE YOUR MNEMONIC (shown only once):")
+        _log(f"   {wallet['mnemonic']}")
 
     result["wallet_address"] = wallet["address"]
     result["wallet_mnemonic"] = wallet["mnemonic"]
 
     # -- STEP 2: Validate & compute stake ------------------------------
-    print("\n[coins] Step 2: Computing stake amount...")
-    min_stake = MIN_STAKE_MICROALGOS.get(cat_upper, 15_000_000)
+    _log("\n[coins] Step 2: Computing stake amount...")
+    min_stake = _min_stake_for(cat_upper)
     if stake_amount_microalgos <= 0:
         stake_amount_microalgos = min_stake
-        print(f"   Using default stake for {cat_upper}: {min_stake / 1_000_000:.0f} ALGO")
+        _log(f"   Using default stake for {cat_upper}: {MIN_STAKE_ALGO[cat_upper]} ALGO")
     else:
         validate_stake_amount(cat_upper, stake_amount_microalgos)
-        print(f"   Stake: {stake_amount_microalgos / 1_000_000:.0f} ALGO (min: {min_stake / 1_000_000:.0f})")
+        _log(f"   Stake: {stake_amount_microalgos / 1_000_000:.0f} ALGO (min: {MIN_STAKE_ALGO[cat_upper]})")
 
+    # Rounded display value, formatted once for the summary lines below
+    stake_algo = f"{stake_amount_microalgos / 1_000_000:.0f}"
     result["stake_amount"] = stake_amount_microalgos
     result["stake_locked"] = True
 
     # -- STEP 3: Encrypt Evidence --------------------------------------
-    print("\n[lock] Step 3: Encrypting evidence files with AES-256-GCM...")
+    _log("\n[lock] Step 3: Encrypting evidence files with AES-256-GCM...")
     encryption_key = generate_encryption_key()
     result["encryption_key_hex"] = key_to_hex(encryption_key)
 
     for fp in file_paths:
-        if not os.path.exists(fp):
-            raise FileNotFoundError(f"Evidence file not found: {fp}")
-        size_kb = os.path.getsize(fp) / 1024
-        print(f"   {os.path.basename(fp)} ({size_kb:.1f} KB)")
+        try:
+            size_kb = os.stat(fp).st_size / 1024
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Evidence file not found: {fp}") from None
+        _log(f"   {os.path.basename(fp)} ({size_kb:.1f} KB)")
+
+    _log(f"   Encrypting {len(file_paths)} file(s) as a streamed AES-256-GCM bundle")
+    _log(f"   Encryption key (SAVE THIS): {result['encryption_key_hex']}")
+
+    # Resolve the App ID up front so a missing deployment fails before upload
+    if app_id is None:
+        app_id = _resolve_app_id()
 
-    encrypted_bundle = encrypt_files_to_bundle(file_paths, encryption_key)
-    print(f"   Encrypted bundle: {len(encrypted_bundle)} bytes")
-    print(f"   Encryption key (SAVE THIS): {result['encryption_key_hex']}")
+    if not app_id:
+        raise ValueError(
+            "EVIDENCE_REGISTRY_APP_ID not set. Deploy the contract first."
+        )
 
     # -- STEP 4: Upload to IPFS ----------------------------------------
-    print("\n[upload] Step 4: Uploading encrypted evidence to IPFS...")
-    ipfs_result = upload_bytes_to_ipfs(
-        encrypted_bundle,
-        filename=f"whistlechain_evidence_{int(time.time())}.json",
-    )
+    _log("\n[upload] Step 4: Uploading encrypted evidence to IPFS...")
+    # The upload only feeds ipfs_hash into app_args, so run it in the
+    # background while the algod round trip for suggested params happens.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        upload_future = pool.submit(
+            upload_stream_to_ipfs,
+            encrypt_files_to_bundle_stream(file_paths, encryption_key),
+            filename=f"whistlechain_evidence_{int(time.time())}.bin",
+        )
+
+        client = get_algod_client()
+        sp = get_suggested_params(client)
+        sp.flat_fee = True
+        sp.fee = 1000  # minimum fee, no inner txns
+
+        ipfs_result = upload_future.result()
 
     ipfs_hash = ipfs_result["IpfsHash"]
     result["ipfs_hash"] = ipfs_hash
     result["ipfs_url"] = get_ipfs_url(ipfs_hash)
     result["ipfs_pin_size"] = ipfs_result.get("PinSize", 0)
 
-    print(f"   Uploaded to IPFS!")
-    print(f"   IPFS Hash : {ipfs_hash}")
-    print(f"   URL       : {result['ipfs_url']}")
+    _log(f"   Uploaded to IPFS!")
+    _log(f"   IPFS Hash : {ipfs_hash}")
+    _log(f"   URL       : {result['ipfs_url']}")
 
     # -- STEP 5: Record on Algorand Blockchain -------------------------
-    print("\n[chain] Step 5: Anchoring evidence + locking stake on Algorand...")
-
-    # Get App ID
-    if app_id is None:
-        app_id_str = os.getenv("EVIDENCE_REGISTRY_APP_ID", "")
-        if not app_id_str:
-            ids_path = os.path.join(
-                os.path.dirname(__file__), "..", "smart-contracts", "deploy", "contract_ids.json"
-            )
-            if os.path.exists(ids_path):
-                with open(ids_path) as f:
-                    ids = json.load(f)
-                app_id = ids.get("evidence_registry", {}).get("app_id")
-
-        if app_id_str and app_id is None:
-            app_id = int(app_id_str)
-
-    if not app_id:
-        raise ValueError(
-            "EVIDENCE_REGISTRY_APP_ID not set. Deploy the contract first."
-        )
-
-    client = get_algod_client()
-    sp = client.suggested_params()
+    _log("\n[chain] Step 5: Anchoring evidence + locking stake on Algorand...")
 
     # Compute application address for stake payment
     app_address = get_application_address(app_id)
-    print(f"   Contract App ID  : {app_id}")
-    print(f"   Contract Address : {app_address}")
-    print(f"   Stake to lock    : {stake_amount_microalgos / 1_000_000:.0f} ALGO")
+    _log(f"   Contract App ID  : {app_id}")
+    _log(f"   Contract Address : {app_address}")
+    _log(f"   Stake to lock    : {stake_algo} ALGO")
 
     # Build application call transaction
     app_call_txn = transaction.ApplicationCallTxn(
@@ -239,12 +364,13 @@ def submit_evidence(
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
         app_args=[
-            b"submit_evidence",
-            ipfs_hash.encode("utf-8"),
-            cat_upper.encode("utf-8"),
-            organization.encode("utf-8")[:64],
-            description.encode("utf-8")[:128],
-            str(stake_amount_microalgos).encode("utf-8"),
+            METHOD_SELECTORS["submit_evidence"],
+            _encode_evidence_fields(
+                ipfs_hash.encode("utf-8"),
+                organization.encode("utf-8")[:64],
+                description.encode("utf-8")[:128],
+            ),
+            CATEGORY_BYTES[cat_upper],
         ],
         boxes=[
             (app_id, b"EVD-" + b"\x00" * 8),  # placeholder box ref
@@ -265,18 +391,17 @@ def submit_evidence(
         pay_txn.group = gid
         app_call_txn.group = gid
 
-        signed_pay = pay_txn.sign(wallet["private_key"])
-        signed_app = app_call_txn.sign(wallet["private_key"])
+        signed_group = _sign_group([pay_txn, app_call_txn], wallet["private_key"])
 
-        tx_id = client.send_transactions([signed_pay, signed_app])
-        print(f"   Transaction sent: {tx_id}")
-        print(f"   Stake locked in contract account (non-withdrawable)")
+        tx_id = client.send_transactions(signed_group)
+        _log(f"   Transaction sent: {tx_id}")
+        _log(f"   Stake locked in contract account (non-withdrawable)")
     else:
         # Free tier: just the AppCall, no payment
         signed_app = app_call_txn.sign(wallet["private_key"])
         tx_id = client.send_transaction(signed_app)
-        print(f"   Transaction sent: {tx_id}")
-        print(f"   Free-tier submission (no stake locked)")
+        _log(f"   Transaction sent: {tx_id}")
+        _log(f"   Free-tier submission (no stake locked)")
 
     # Wait for confirmation
     confirmed = transaction.wait_for_confirmation(client, tx_id, 10)
@@ -286,16 +411,21 @@ def submit_evidence(
     result["timestamp"] = int(time.time())
 
     # Parse evidence ID from logs
+    # b"evidence_id:" is 12 bytes, so its base64 form is a fixed prefix and
+    # only the matching log entry needs decoding.
     evidence_counter = 1
-    if "logs" in confirmed:
-        for log_entry in confirmed["logs"]:
-            decoded = base64.b64decode(log_entry)
-            if decoded.startswith(b"evidence_id:"):
-                counter_bytes = decoded[len(b"evidence_id:"):]
-                evidence_counter = int.from_bytes(counter_bytes, "big")
-
-    year = time.strftime("%Y")
-    evidence_id = f"EVD-{year}-{evidence_counter:05d}"
+    id_log = next(
+        (
+            entry for entry in reversed(confirmed.get("logs", ()))
+            if entry.startswith(EVIDENCE_ID_LOG_B64_PREFIX)
+        ),
+        None,
+    )
+    if id_log is not None:
+        decoded = base64.b64decode(id_log)
+        evidence_counter = int.from_bytes(decoded[len(b"evidence_id:"):], "big")
+
+    evidence_id = format_evidence_id(evidence_counter)
     result["evidence_id"] = evidence_id
     result["status"] = "PENDING"
     result["category"] = cat_upper
@@ -304,25 +434,25 @@ def submit_evidence(
 
     # -- Summary -------------------------------------------------------
     tier_label = "STAKED" if stake_amount_microalgos > 0 else "FREE"
-    print("\n" + "=" * 56)
-    print(f"  EVIDENCE SUBMITTED ({tier_label} TIER)")
-    print("=" * 56)
-    print(f"  Evidence ID    : {evidence_id}")
-    print(f"  IPFS Hash      : {ipfs_hash}")
-    print(f"  IPFS URL       : {result['ipfs_url']}")
-    print(f"  Transaction    : {tx_id}")
-    print(f"  Block          : #{result['block']}")
-    print(f"  Timestamp      : {time.strftime('%d %b %Y %H:%M IST')}")
-    print(f"  Status         : PENDING")
-    print(f"  Category       : {cat_upper}")
-    print(f"  Organization   : {organization}")
-    print(f"  Stake Locked   : {stake_amount_microalgos / 1_000_000:.0f} ALGO")
-    print("---")
-    print(f"  Your identity is never stored anywhere.")
-    print(f"  Encryption key: {result['encryption_key_hex']}")
-    print(f"  Wallet: {wallet['address']}")
-    print(f"  Stake outcome: returned if verified, forfeited if fake.")
-    print("=" * 56)
+    _log("\n" + "=" * 56)
+    _log(f"  EVIDENCE SUBMITTED ({tier_label} TIER)")
+    _log("=" * 56)
+    _log(f"  Evidence ID    : {evidence_id}")
+    _log(f"  IPFS Hash      : {ipfs_hash}")
+    _log(f"  IPFS URL       : {result['ipfs_url']}")
+    _log(f"  Transaction    : {tx_id}")
+    _log(f"  Block          : #{result['block']}")
+    _log(f"  Timestamp      : {time.strftime('%d %b %Y %H:%M IST', time.localtime(result['timestamp']))}")
+    _log(f"  Status         : PENDING")
+    _log(f"  Category       : {cat_upper}")
+    _log(f"  Organization   : {organization}")
+    _log(f"  Stake Locked   : {stake_algo} ALGO")
+    _log("---")
+    _log(f"  Your identity is never stored anywhere.")
+    _log(f"  Encryption key: {result['encryption_key_hex']}")
+    _log(f"  Wallet: {wallet['address']}")
+    _log(f"  Stake outcome: returned if verified, forfeited if fake.")
+    _log("=" * 56)
 
     return result
 
@@ -338,7 +468,7 @@ def submit_evidence_simple(
     Simplified evidence submission (uses category default stake, reads app_id from env).
     """
     cat_upper = category.upper()
-    default_stake = MIN_STAKE_MICROALGOS.get(cat_upper, 15_000_000)
+    default_stake = _min_stake_for(cat_upper)
     return submit_evidence(
         file_paths=file_paths,
         category=category,
@@ -21,6 +21,12 @@ import json
 import time
 import tempfile
 
+try:
+    # Optional: faster JSON serialization for the results file
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add project paths
 sys.path.insert(0, os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
@@ -33,7 +39,7 @@ load_dotenv()
 from backend.services.wallet import create_anonymous_wallet
 from backend.services.encryption import (
     generate_encryption_key,
-    encrypt_files_to_bundle,
+    encrypt_files_to_bundle_fast,
     decrypt_bundle,
     key_to_hex,
     key_from_hex,
@@ -42,14 +48,8 @@ from backend.services.ipfs_upload import upload_bytes_to_ipfs, get_ipfs_url
 from backend.services.algorand_client import get_algod_client, check_connection
 
 
-def create_sample_evidence_files() -> list[str]:
-    """Create sample evidence files for demo purposes."""
-    tmp_dir = tempfile.mkdtemp(prefix="whistlechain_demo_")
-
-    # Sample invoice document
-    invoice_path = os.path.join(tmp_dir, "fake_invoice.txt")
-    with open(invoice_path, "w", encoding="utf-8") as f:
-        f.write("""
+# Sample invoice document
+_INVOICE_BYTES = """
 INVOICE — ABC Construction Ltd
 ================================
 Invoice No: INV-2025-4521
@@ -68,12 +68,10 @@ Bank Details: XYZ Bank, Account: 1234567890
 NOTE: Government procurement portal shows approved amount
       of only ₹4,50,00,000 (Four Crore Fifty Lakh).
       DISCREPANCY: ₹5,50,00,000 (122% inflation)
-""")
+""".encode("utf-8")
 
-    # Sample email evidence
-    email_path = os.path.join(tmp_dir, "internal_email.txt")
-    with open(email_path, "w", encoding="utf-8") as f:
-        f.write("""
+# Sample email evidence
+_EMAIL_BYTES = """
 From: contractor@abcconstruction.com
 To: procurement@abcconstruction.com
 Date: 10 Jan 2026
@@ -84,12 +82,10 @@ instead of the actual supply cost of ₹4 crore.
 The difference will be handled through the usual channel.
 
 Do NOT send this over official email next time.
-""")
+""".encode("utf-8")
 
-    # Sample approval document
-    approval_path = os.path.join(tmp_dir, "govt_approval.txt")
-    with open(approval_path, "w", encoding="utf-8") as f:
-        f.write("""
+# Sample approval document
+_APPROVAL_BYTES = """
 GOVERNMENT OF INDIA
 PUBLIC WORKS DEPARTMENT
 ========================
@@ -102,9 +98,25 @@ Approval Date: 01 Dec 2025
 Approved By: Chief Engineer, PWD
 
 This document is system-generated from e-Procurement portal.
-""")
+""".encode("utf-8")
+
+_SAMPLE_EVIDENCE = (
+    ("fake_invoice.txt", _INVOICE_BYTES),
+    ("internal_email.txt", _EMAIL_BYTES),
+    ("govt_approval.txt", _APPROVAL_BYTES),
+)
+
+def create_sample_evidence_files() -> list[str]:
+    """Create sample evidence files for demo purposes."""
+    tmp_dir = tempfile.mkdtemp(prefix="whistlechain_demo_")
 
-    return [invoice_path, email_path, approval_path]
+    paths = []
+    for name, content in _SAMPLE_EVIDENCE:
+        path = os.path.join(tmp_dir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        paths.append(path)
+    return paths
 
 
 def run_demo():
@@ -153,7 +165,7 @@ def run_demo():
     encryption_key = generate_encryption_key()
     key_hex = key_to_hex(encryption_key)
 
-    encrypted_bundle = encrypt_files_to_bundle(sample_files, encryption_key)
+    encrypted_bundle = encrypt_files_to_bundle_fast(sample_files, encryption_key)
     print(f"  ✅ {len(sample_files)} files encrypted")
     print(f"  Bundle size: {len(encrypted_bundle)} bytes")
     print(f"  Encryption key: {key_hex[:16]}...{key_hex[-8:]}")
@@ -174,7 +186,7 @@ def run_demo():
         try:
             ipfs_result = upload_bytes_to_ipfs(
                 encrypted_bundle,
-                filename=f"whistlechain_evidence_{int(time.time())}.json",
+                filename=f"whistlechain_evidence_{int(time.time())}.bin",
             )
             ipfs_hash = ipfs_result["IpfsHash"]
             print(f"  ✅ Uploaded to IPFS!")
@@ -272,8 +284,12 @@ def run_demo():
     }
 
     output_path = os.path.join(os.path.dirname(__file__), "demo_submission_result.json")
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(results, f, indent=2)
 
     print(f"\n  📁 Full results saved to: demo_submission_result.json")
 
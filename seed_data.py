@@ -1,123 +1,170 @@
 import requests
+from requests.adapters import HTTPAdapter
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 B = 'http://localhost:8000'
 
-# 1. Create wallet
-w = requests.post(B+'/wallet/create').json()
-print('Wallet:', w['address'][:12])
-
-# 2. Submit evidence (backend expects: FINANCIAL, CONSTRUCTION, FOOD, ACADEMIC)
-files = [('files', ('report.pdf', io.BytesIO(b'Evidence data content for testing'), 'application/pdf'))]
-sub = requests.post(B+'/evidence/submit', data={
-    'category': 'FINANCIAL',
-    'organization': 'Acme Corp',
-    'description': 'Fraudulent accounting practices discovered in Q3 reports',
-    'wallet_mnemonic': w['mnemonic'],
-    'stake_amount': '50'
-}, files=files).json()
-print('Submit response:', sub)
-eid = sub['evidence_id']
-print('Evidence:', eid)
-
-# 3. Register inspectors
-inspectors = []
-for i in range(3):
-    iw = requests.post(B+'/wallet/create').json()
-    r = requests.post(B+'/verification/register-inspector', json={
+WORKERS = 8
+
+# requests.Session is not thread-safe, so each worker thread keeps its own
+# keep-alive session (and connection pool) instead of sharing one
+_local = threading.local()
+
+
+def session():
+    s = getattr(_local, 'session', None)
+    if s is None:
+        s = requests.Session()
+        s.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        s.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        _local.session = s
+    return s
+
+
+def register_inspector(i):
+    S = session()
+    iw = S.post(B+'/wallet/create').json()
+    r = S.post(B+'/verification/register-inspector', json={
         'address': iw['address'],
         'name': 'Inspector_' + str(i+1),
         'specializations': ['FINANCIAL']
     })
-    print('Register inspector', i+1, ':', r.status_code)
-    inspectors.append(iw)
-
-# 4. Begin verification (needs evidence_id + category)
-r = requests.post(B+'/verification/begin', json={
-    'evidence_id': eid,
-    'category': 'FINANCIAL'
-})
-print('Begin verification:', r.status_code, r.text[:200])
-
-# 5. Commit phase (generate-commit uses verdict + nonce)
-nonces = []
-for i, iw in enumerate(inspectors):
-    nonce = 'secret_' + str(i)
-    h = requests.post(B+'/verification/generate-commit', json={
+    return iw, r
+
+
+def commit(eid, iw, nonce):
+    S = session()
+    h = S.post(B+'/verification/generate-commit', json={
         'verdict': 1, 'nonce': nonce
     }).json()
-    print('GenerateCommit', i+1, ':', h.get('commit_hash', 'ERROR')[:16])
-    nonces.append(nonce)
-    r = requests.post(B+'/verification/commit', json={
+    r = S.post(B+'/verification/commit', json={
         'evidence_id': eid,
         'inspector_address': iw['address'],
         'commit_hash': h['commit_hash']
     })
-    print('Commit', i+1, ':', r.status_code)
+    return h, r
 
-# 6. Advance to reveal (query param)
-r = requests.post(B+'/verification/advance-to-reveal', params={'evidence_id': eid})
-print('Advance to reveal:', r.status_code, r.text[:100])
 
-# 7. Reveal (needs verdict, nonce, justification_ipfs)
-for i, iw in enumerate(inspectors):
-    r = requests.post(B+'/verification/reveal', json={
+def reveal(eid, i, iw, nonce):
+    return session().post(B+'/verification/reveal', json={
         'evidence_id': eid,
         'inspector_address': iw['address'],
         'verdict': 1,
-        'nonce': nonces[i],
+        'nonce': nonce,
         'justification_ipfs': 'QmTestJustification' + str(i)
     })
-    print('Reveal', i+1, ':', r.status_code, r.text[:100])
 
-# 8. Finalize (query param)
-r = requests.post(B+'/verification/finalize', params={'evidence_id': eid})
-print('Finalize:', r.status_code, r.text[:200])
 
-# 9. Resolve (query param)
-r = requests.post(B+'/resolution/resolve', params={'evidence_id': eid})
-print('Resolve:', r.status_code, r.text[:200])
-
-# 10. Bounty
-r = requests.post(B+'/bounty/process/' + eid)
-print('Bounty:', r.status_code, r.text[:200])
-
-# 11. Publish (query param)
-r = requests.post(B+'/audit/publish', params={'evidence_id': eid})
-print('Audit publish:', r.status_code, r.text[:200])
-r = requests.post(B+'/publication/publish/' + eid)
-print('Publication:', r.status_code, r.text[:200])
-
-# Submit more for variety
-for cat in ['CONSTRUCTION', 'FOOD', 'ACADEMIC']:
-    w2 = requests.post(B+'/wallet/create').json()
+def submit_extra(cat):
+    S = session()
+    w2 = S.post(B+'/wallet/create').json()
     files2 = [('files', ('doc.txt', io.BytesIO(b'Test document'), 'text/plain'))]
-    r = requests.post(B+'/evidence/submit', data={
+    return S.post(B+'/evidence/submit', data={
         'category': cat,
         'organization': cat.title() + ' Organization',
         'description': 'Evidence of ' + cat.lower() + ' irregularities detected',
         'wallet_mnemonic': w2['mnemonic'],
         'stake_amount': '0'
     }, files=files2)
-    print('Extra', cat, ':', r.status_code)
-
-# Stats
-print('\n=== Final State ===')
-try:
-    print('Submissions:', len(requests.get(B+'/submissions/all').json()))
-except: print('Submissions: error')
-try:
-    print('Sessions:', len(requests.get(B+'/verification/sessions').json()))
-except: print('Sessions: error')
-try:
-    print('Resolutions:', len(requests.get(B+'/resolution/all/list').json()))
-except: print('Resolutions: error')
-try:
-    print('Audit records:', len(requests.get(B+'/audit/records').json()))
-except: print('Audit: error')
-try:
-    print('Bounty payouts:', len(requests.get(B+'/bounty/payouts').json()))
-except: print('Bounty: error')
-try:
-    print('Publications:', len(requests.get(B+'/publication/records/all').json()))
-except: print('Publications: error')
+
+
+def main():
+    S = session()
+
+    # Calls within a step are independent, so they are issued concurrently;
+    # the steps themselves (begin -> commit -> reveal -> finalize) stay ordered.
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        # 1. Create wallet
+        w = S.post(B+'/wallet/create').json()
+        print('Wallet:', w['address'][:12])
+
+        # 2. Submit evidence (backend expects: FINANCIAL, CONSTRUCTION, FOOD, ACADEMIC)
+        files = [('files', ('report.pdf', io.BytesIO(b'Evidence data content for testing'), 'application/pdf'))]
+        sub = S.post(B+'/evidence/submit', data={
+            'category': 'FINANCIAL',
+            'organization': 'Acme Corp',
+            'description': 'Fraudulent accounting practices discovered in Q3 reports',
+            'wallet_mnemonic': w['mnemonic'],
+            'stake_amount': '50'
+        }, files=files).json()
+        print('Submit response:', sub)
+        eid = sub['evidence_id']
+        print('Evidence:', eid)
+
+        # 3. Register inspectors
+        inspectors = []
+        for i, (iw, r) in enumerate(pool.map(register_inspector, range(3))):
+            print('Register inspector', i+1, ':', r.status_code)
+            inspectors.append(iw)
+
+        # 4. Begin verification (needs evidence_id + category)
+        r = S.post(B+'/verification/begin', json={
+            'evidence_id': eid,
+            'category': 'FINANCIAL'
+        })
+        print('Begin verification:', r.status_code, r.text[:200])
+
+        # 5. Commit phase (generate-commit uses verdict + nonce)
+        n = len(inspectors)
+        nonces = ['secret_' + str(i) for i in range(n)]
+        for i, (h, r) in enumerate(pool.map(commit, [eid] * n, inspectors, nonces)):
+            print('GenerateCommit', i+1, ':', h.get('commit_hash', 'ERROR')[:16])
+            print('Commit', i+1, ':', r.status_code)
+
+        # 6. Advance to reveal (query param)
+        r = S.post(B+'/verification/advance-to-reveal', params={'evidence_id': eid})
+        print('Advance to reveal:', r.status_code, r.text[:100])
+
+        # 7. Reveal (needs verdict, nonce, justification_ipfs)
+        for i, r in enumerate(pool.map(reveal, [eid] * n, range(n), inspectors, nonces)):
+            print('Reveal', i+1, ':', r.status_code, r.text[:100])
+
+        # 8. Finalize (query param)
+        r = S.post(B+'/verification/finalize', params={'evidence_id': eid})
+        print('Finalize:', r.status_code, r.text[:200])
+
+        # 9. Resolve (query param)
+        r = S.post(B+'/resolution/resolve', params={'evidence_id': eid})
+        print('Resolve:', r.status_code, r.text[:200])
+
+        # 10. Bounty
+        r = S.post(B+'/bounty/process/' + eid)
+        print('Bounty:', r.status_code, r.text[:200])
+
+        # 11. Publish (query param)
+        r = S.post(B+'/audit/publish', params={'evidence_id': eid})
+        print('Audit publish:', r.status_code, r.text[:200])
+        r = S.post(B+'/publication/publish/' + eid)
+        print('Publication:', r.status_code, r.text[:200])
+
+        # Submit more for variety
+        extra_cats = ['CONSTRUCTION', 'FOOD', 'ACADEMIC']
+        for cat, r in zip(extra_cats, pool.map(submit_extra, extra_cats)):
+            print('Extra', cat, ':', r.status_code)
+
+    # Stats
+    print('\n=== Final State ===')
+    try:
+        print('Submissions:', len(S.get(B+'/submissions/all').json()))
+    except: print('Submissions: error')
+    try:
+        print('Sessions:', len(S.get(B+'/verification/sessions').json()))
+    except: print('Sessions: error')
+    try:
+        print('Resolutions:', len(S.get(B+'/resolution/all/list').json()))
+    except: print('Resolutions: error')
+    try:
+        print('Audit records:', len(S.get(B+'/audit/records').json()))
+    except: print('Audit: error')
+    try:
+        print('Bounty payouts:', len(S.get(B+'/bounty/payouts').json()))
+    except: print('Bounty: error')
+    try:
+        print('Publications:', len(S.get(B+'/publication/records/all').json()))
+    except: print('Publications: error')
+
+
+if __name__ == '__main__':
+    main()
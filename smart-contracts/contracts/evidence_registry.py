@@ -6,7 +6,7 @@ Master record of all evidence submissions on Algorand.
 State:
   - Global: evidence_counter (uint64), admin (address),
             total_staked (uint64), total_forfeited (uint64)
-  - Box per evidence: evidence_id -> serialized metadata
+  - Box per evidence: evidence_id -> packed binary metadata
 
 Methods:
   - submit_evidence  -> creates on-chain record with locked stake, returns evidence_id
@@ -31,8 +31,20 @@ Public Record (Step 5):
 """
 
 from algosdk import abi, transaction, encoding
+import functools
+from binascii import a2b_base64
+import hashlib
 import json
+import struct
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
+
+try:
+    # Optional: vectorized header decode in parse_evidence_batch
+    import numpy as np
+except ImportError:
+    np = None
 
 # ------------------------------------------------
 # ABI Method Definitions for the Evidence Registry
@@ -53,22 +65,25 @@ STATUS_PUBLISHED = 4
 STATUS_UNDER_VERIFICATION = 5
 STATUS_RESOLVED = 6
 
-STATUS_LABELS = {
-    STATUS_PENDING: "PENDING",
-    STATUS_VERIFIED: "VERIFIED",
-    STATUS_DISPUTED: "DISPUTED",
-    STATUS_REJECTED: "REJECTED",
-    STATUS_PUBLISHED: "PUBLISHED",
-    STATUS_UNDER_VERIFICATION: "UNDER_VERIFICATION",
-    STATUS_RESOLVED: "RESOLVED",
-}
-
-CATEGORY_LABELS = {
-    CATEGORY_FINANCIAL: "FINANCIAL",
-    CATEGORY_CONSTRUCTION: "CONSTRUCTION",
-    CATEGORY_FOOD: "FOOD",
-    CATEGORY_ACADEMIC: "ACADEMIC",
-}
+# Label tuples are indexed directly by the dense integer codes above
+STATUS_LABELS = (
+    "PENDING",              # STATUS_PENDING
+    "VERIFIED",             # STATUS_VERIFIED
+    "DISPUTED",             # STATUS_DISPUTED
+    "REJECTED",             # STATUS_REJECTED
+    "PUBLISHED",            # STATUS_PUBLISHED
+    "UNDER_VERIFICATION",   # STATUS_UNDER_VERIFICATION
+    "RESOLVED",             # STATUS_RESOLVED
+)
+assert len(STATUS_LABELS) == STATUS_RESOLVED + 1
+
+CATEGORY_LABELS = (
+    "FINANCIAL",            # CATEGORY_FINANCIAL
+    "CONSTRUCTION",         # CATEGORY_CONSTRUCTION
+    "FOOD",                 # CATEGORY_FOOD
+    "ACADEMIC",             # CATEGORY_ACADEMIC
+)
+assert len(CATEGORY_LABELS) == CATEGORY_ACADEMIC + 1
 
 # Minimum stakes per category (in microAlgos: 1 ALGO = 1_000_000)
 MIN_STAKE = {
@@ -77,12 +92,33 @@ MIN_STAKE = {
     "FOOD": 25_000_000,           # 25 ALGO
     "ACADEMIC": 15_000_000,       # 15 ALGO
 }
+# Same values indexed by CATEGORY_* id
+MIN_STAKE_BY_ID = tuple(MIN_STAKE[label] for label in CATEGORY_LABELS)
 
 # Stake status codes stored in box
 STAKE_LOCKED = 0
 STAKE_REFUNDED = 1
 STAKE_FORFEITED = 2
 
+# Evidence box layout (version 2): fixed header followed by three
+# length-prefixed fields (ipfs_hash, organization, description)
+EVIDENCE_BOX_VERSION = 2
+_EVIDENCE_BOX_HEADER = struct.Struct(">B32sQQQBB")
+_FIELD_LEN = struct.Struct(">H")
+# Header offsets the lifecycle methods write in place (box_replace)
+EVIDENCE_STATUS_OFFSET = struct.calcsize(">B32sQ")           # status uint64
+EVIDENCE_STAKE_STATUS_OFFSET = struct.calcsize(">B32sQQQ")   # stake_status byte
+# Same header as a NumPy structured dtype (packed, big-endian)
+_HEADER_DTYPE = np.dtype([
+    ("version", "u1"),
+    ("submitter", "V32"),     # raw bytes; "S32" would strip trailing NULs
+    ("timestamp", ">u8"),
+    ("status", ">u8"),
+    ("stake", ">u8"),
+    ("stake_status", "u1"),
+    ("category", "u1"),
+]) if np is not None else None
+
 # Verification constants
 MIN_INSPECTORS = 3          # minimum inspectors for quorum
 VERIFICATION_WINDOW_HOURS = {
@@ -91,17 +127,49 @@ VERIFICATION_WINDOW_HOURS = {
     "FOOD": 48,
     "ACADEMIC": 72,
 }
+VERIFICATION_WINDOW_HOURS_BY_ID = tuple(
+    VERIFICATION_WINDOW_HOURS[label] for label in CATEGORY_LABELS
+)
 CONSENSUS_THRESHOLD = 0.67  # 67% agreement required
 
+# Per-inspector commit/reveal box ("INS-" + counter + sender)
+INSPECTOR_BOX_SIZE = 113    # phase(1) + commit(32) + verdict(8) + ts(8) + ipfs(64)
+INSPECTOR_PHASE_COMMITTED = 0
+INSPECTOR_PHASE_REVEALED = 1
+
 # Inspector verdict codes
 VERDICT_AUTHENTIC = 1
 VERDICT_FAKE = 2
 VERDICT_INCONCLUSIVE = 3
 
-VERDICT_LABELS = {
-    VERDICT_AUTHENTIC: "AUTHENTIC",
-    VERDICT_FAKE: "FAKE",
-    VERDICT_INCONCLUSIVE: "INCONCLUSIVE",
+VERDICT_LABELS = (
+    "UNKNOWN",              # 0 is not a valid verdict
+    "AUTHENTIC",            # VERDICT_AUTHENTIC
+    "FAKE",                 # VERDICT_FAKE
+    "INCONCLUSIVE",         # VERDICT_INCONCLUSIVE
+)
+assert len(VERDICT_LABELS) == VERDICT_INCONCLUSIVE + 1
+
+# Method signatures; the first 4 bytes of SHA-512/256 of each signature
+# (ARC-4 style) is the selector passed as ApplicationArgs[0] and matched
+# in handle_noop below
+METHOD_SIGNATURES = {
+    "submit_evidence": "submit_evidence(byte[],byte)void",
+    "update_status": "update_status(byte[],byte[])void",
+    "get_evidence": "get_evidence(byte[])void",
+    "refund_stake": "refund_stake(byte[],uint64,address)void",
+    "forfeit_stake": "forfeit_stake(byte[],uint64)void",
+    "begin_verification": "begin_verification(byte[],uint64,uint64)void",
+    "commit_verdict": "commit_verdict(byte[],byte[32])void",
+    "reveal_verdict": "reveal_verdict(byte[],uint64,byte[],byte[])void",
+    "finalize_verification": "finalize_verification(byte[],byte[],byte[])void",
+    "resolve_evidence": "resolve_evidence(byte[],uint64,address,uint64,byte[])void",
+    "publish_evidence": "publish_evidence(byte[],byte[],byte[])void",
+}
+
+METHOD_SELECTORS = {
+    name: hashlib.new("sha512_256", sig.encode("utf-8")).digest()[:4]
+    for name, sig in METHOD_SIGNATURES.items()
 }
 
 # ------------------------------------------------
@@ -113,6 +181,12 @@ VERDICT_LABELS = {
 APPROVAL_TEAL = """
 #pragma version 10
 
+// Constant pools: the most repeated literals, referenced by 1-byte intc_N /
+// bytec_N opcodes. Single-use literals stay as int/byte (pushint/pushbytes).
+// intc_2..intc 4 are the distinct MIN_STAKE values (25, 50, 15 ALGO).
+intcblock 0 1 25000000 50000000 15000000
+bytecblock "|" "evidence_counter" "total_forfeited" "admin" "total_staked"
+
 // ============================================
 // WhistleChain Evidence Registry -- Approval Program (v3 -- Verification)
 // ============================================
@@ -124,13 +198,13 @@ APPROVAL_TEAL = """
 //
 // Box Storage (per evidence):
 //   key = "EVD-" + 8-byte big-endian counter
-//   value = pipe-delimited metadata
+//   value = packed binary metadata (see submit_evidence)
 //
 // Box Storage (per verification):
 //   key = "VRF-" + 8-byte evidence counter
 //   value = verification metadata (inspector verdicts, commit hashes, etc.)
 //
-// Methods (ABI-style, routed by first app arg):
+// Methods (routed by the 4-byte selector in the first app arg):
 //   submit_evidence     -> creates on-chain record with locked stake
 //   update_status       -> admin updates evidence status
 //   get_evidence        -> reads evidence metadata
@@ -146,7 +220,7 @@ APPROVAL_TEAL = """
 
 // Route based on OnComplete
 txn ApplicationID
-int 0
+intc_0
 ==
 bnz handle_create
 
@@ -174,128 +248,87 @@ err
 
 handle_create:
     // Initialize global state
-    byte "evidence_counter"
-    int 0
+    bytec_1 // "evidence_counter"
+    intc_0
     app_global_put
 
-    byte "admin"
+    bytec_3 // "admin"
     txn Sender
     app_global_put
 
-    byte "total_staked"
-    int 0
+    bytec 4 // "total_staked"
+    intc_0
     app_global_put
 
-    byte "total_forfeited"
-    int 0
+    bytec_2 // "total_forfeited"
+    intc_0
     app_global_put
 
-    int 1
+    intc_1
     return
 
 handle_optin:
-    int 1
+    intc_1
     return
 
 handle_delete:
     // Only admin can delete
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
+    callsub assert_admin
+    intc_1
     return
 
 handle_update:
     // Only admin can update
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
+    callsub assert_admin
+    intc_1
     return
 
 handle_noop:
     // Route by first app arg
     txn NumAppArgs
-    int 0
+    intc_0
     ==
     bnz handle_noop_bare
 
+    // match jumps to the label whose case equals the 4-byte method
+    // selector (cases are pushed first, the value to match last)
+    byte 0xe6569ed4      // submit_evidence
+    byte 0x5cc0b0fa      // update_status
+    byte 0x589a6845      // get_evidence
+    byte 0x33b99a04      // refund_stake
+    byte 0xb831f54a      // forfeit_stake
+    byte 0x1935d635      // begin_verification
+    byte 0xa913c2fd      // commit_verdict
+    byte 0x757341f8      // reveal_verdict
+    byte 0x01bb706c      // finalize_verification
+    byte 0x20f139fc      // resolve_evidence
+    byte 0x13ce324b      // publish_evidence
     txna ApplicationArgs 0
-    byte "submit_evidence"
-    ==
-    bnz method_submit_evidence
-
-    txna ApplicationArgs 0
-    byte "update_status"
-    ==
-    bnz method_update_status
-
-    txna ApplicationArgs 0
-    byte "get_evidence"
-    ==
-    bnz method_get_evidence
-
-    txna ApplicationArgs 0
-    byte "refund_stake"
-    ==
-    bnz method_refund_stake
-
-    txna ApplicationArgs 0
-    byte "forfeit_stake"
-    ==
-    bnz method_forfeit_stake
-
-    txna ApplicationArgs 0
-    byte "begin_verification"
-    ==
-    bnz method_begin_verification
-
-    txna ApplicationArgs 0
-    byte "commit_verdict"
-    ==
-    bnz method_commit_verdict
-
-    txna ApplicationArgs 0
-    byte "reveal_verdict"
-    ==
-    bnz method_reveal_verdict
-
-    txna ApplicationArgs 0
-    byte "finalize_verification"
-    ==
-    bnz method_finalize_verification
-
-    txna ApplicationArgs 0
-    byte "resolve_evidence"
-    ==
-    bnz method_resolve_evidence
-
-    txna ApplicationArgs 0
-    byte "publish_evidence"
-    ==
-    bnz method_publish_evidence
+    match method_submit_evidence method_update_status method_get_evidence method_refund_stake method_forfeit_stake method_begin_verification method_commit_verdict method_reveal_verdict method_finalize_verification method_resolve_evidence method_publish_evidence
 
     err
 
 handle_noop_bare:
-    int 1
+    intc_1
     return
 
 // == submit_evidence ==============================
-// Args: [0]="submit_evidence", [1]=ipfs_hash, [2]=category,
-//       [3]=organization, [4]=description, [5]=stake_amount_str
+// Args: [0]="submit_evidence",
+//       [1]=text fields, each as a 2-byte length + bytes:
+//           ipfs_hash, organization, description (encoded off-chain)
+//       [2]=category id (1 byte)
 // Group: txn 0 = PaymentTxn (stake), txn 1 = this AppCall
 // OR:    txn 0 = this AppCall (no stake / simulated mode)
 method_submit_evidence:
     // Increment evidence counter
-    byte "evidence_counter"
+    bytec_1 // "evidence_counter"
     app_global_get
-    int 1
+    intc_1
     +
     store 0  // new counter in scratch 0
 
     // Save new counter
-    byte "evidence_counter"
+    bytec_1 // "evidence_counter"
     load 0
     app_global_put
 
@@ -306,77 +339,88 @@ method_submit_evidence:
     concat
     store 1  // box key in scratch 1
 
-    // Build value: ipfs_hash|category|org|desc|sender|timestamp|status|stake_amount|stake_status
-    txna ApplicationArgs 1   // ipfs_hash
-    byte "|"
-    concat
-    txna ApplicationArgs 2   // category
-    byte "|"
-    concat
-    concat
-    txna ApplicationArgs 3   // organization
-    byte "|"
-    concat
-    concat
-    txna ApplicationArgs 4   // description
-    byte "|"
-    concat
-    concat
+    // Stake = amount of the grouped payment (txn 0), or 0 if ungrouped
+    // (free tier). A staked submission must pay the app account at least
+    // the category minimum (MIN_STAKE_BY_ID, pooled in the intcblock).
+    intc_0
+    global GroupSize
+    intc_1
+    >
+    bz stake_amount_done
+    pop
+    gtxn 0 TypeEnum
+    int pay
+    ==
+    assert
+    gtxn 0 Receiver
+    global CurrentApplicationAddress
+    ==
+    assert
+    gtxn 0 Amount
+    dup
+    txna ApplicationArgs 2   // category id
+    btoi
+    switch min_stake_financial min_stake_construction min_stake_food min_stake_academic
+    err
+min_stake_financial:
+    intc_2                   // 25 ALGO
+    b min_stake_check
+min_stake_construction:
+    intc_3                   // 50 ALGO
+    b min_stake_check
+min_stake_food:
+    intc_2                   // 25 ALGO
+    b min_stake_check
+min_stake_academic:
+    intc 4                   // 15 ALGO
+min_stake_check:
+    >=
+    assert
+stake_amount_done:
+    store 5  // stake amount in scratch 5
+
+    // Build value (packed binary, version 2):
+    //   version(1) submitter(32) timestamp(8) status(8) stake_amount(8)
+    //   stake_status(1) category(1)
+    //   ipfs_len(2) ipfs_hash  org_len(2) organization  desc_len(2) description
+    byte 0x02                // box format version
     txn Sender               // submitter address (32 bytes)
-    byte "|"
-    concat
     concat
     global LatestTimestamp
     itob
-    byte "|"
-    concat
     concat
-    int 0                    // STATUS_PENDING
+    intc_0                    // STATUS_PENDING
     itob
-    byte "|"
     concat
+    load 5                   // stake amount
+    itob
     concat
-    txna ApplicationArgs 5   // stake amount as string
-    byte "|"
+    byte 0x00                // STAKE_LOCKED
     concat
+    txna ApplicationArgs 2   // category id
+    dup
+    len
+    intc_1
+    ==
+    assert
     concat
-    int 0                    // STAKE_LOCKED
-    itob
+    txna ApplicationArgs 1   // pre-encoded length-prefixed text fields
     concat
     store 2  // value in scratch 2
 
-    // Update total_staked global counter
-    // We check if there's a group payment; if group size > 1 we
-    // trust that the backend validated the amount. On-chain we
-    // simply record the declared stake. A production version would
-    // parse the payment txn amount.
-    byte "total_staked"
-    byte "total_staked"
+    // Update total_staked global counter with the stake actually paid
+    bytec 4 // "total_staked"
+    dup
     app_global_get
-    global GroupSize
-    int 1
-    >
-    bnz add_payment_amount
-    int 0
-    b done_stake_calc
-add_payment_amount:
-    // Read amount from the payment txn (index 0 in group)
-    gtxn 0 Amount
-done_stake_calc:
+    load 5
     +
     app_global_put
 
-    // Create box
-    load 1   // key
-    int 1024 // max box size
-    box_create
-    pop
-
-    // Write value
-    load 1   // key
-    int 0    // offset
+    // Create the box at the value's exact size; later status writes
+    // box_replace fixed header offsets, so no padding is needed
+    load 1   // key (fresh counter, so the box cannot exist yet)
     load 2   // value
-    box_replace
+    box_put
 
     // Log the evidence ID for caller
     byte "evidence_id:"
@@ -385,32 +429,23 @@ done_stake_calc:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == update_status ================================
-// Args: [0]="update_status", [1]=box_key, [2]=new_value_blob
+// Args: [0]="update_status", [1]=box_key, [2]=new_status (uint64)
 method_update_status:
     // Only admin
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
+    callsub assert_admin
 
-    // Read existing box (must exist)
+    // Write status into the box header (box_replace fails if it doesn't exist)
     txna ApplicationArgs 1
-    box_get
-    assert
-    store 3
-
-    // Overwrite box with new value
-    txna ApplicationArgs 1
-    int 0
+    int 41                   // status offset
     txna ApplicationArgs 2
+    callsub assert_uint64_arg
     box_replace
 
-    int 1
+    intc_1
     return
 
 // == get_evidence =================================
@@ -421,7 +456,7 @@ method_get_evidence:
     assert
     log
 
-    int 1
+    intc_1
     return
 
 // == refund_stake =================================
@@ -429,11 +464,7 @@ method_get_evidence:
 // Args: [0]="refund_stake", [1]=box_key, [2]=refund_amount (uint64 as bytes)
 method_refund_stake:
     // Only admin
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
+    callsub assert_admin
 
     // Box must exist
     txna ApplicationArgs 1
@@ -455,7 +486,7 @@ method_refund_stake:
         txna ApplicationArgs 2    // amount (8-byte uint64)
         btoi
         itxn_field Amount
-        int 0
+        intc_0
         itxn_field Fee
     itxn_submit
 
@@ -465,7 +496,7 @@ method_refund_stake:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == forfeit_stake ================================
@@ -473,11 +504,7 @@ method_refund_stake:
 // Args: [0]="forfeit_stake", [1]=box_key, [2]=forfeit_amount (uint64 as bytes)
 method_forfeit_stake:
     // Only admin
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
+    callsub assert_admin
 
     // Box must exist
     txna ApplicationArgs 1
@@ -486,8 +513,8 @@ method_forfeit_stake:
     pop
 
     // Update total_forfeited
-    byte "total_forfeited"
-    byte "total_forfeited"
+    bytec_2 // "total_forfeited"
+    dup
     app_global_get
     txna ApplicationArgs 2
     btoi
@@ -500,7 +527,7 @@ method_forfeit_stake:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == begin_verification ===========================
@@ -511,11 +538,7 @@ method_forfeit_stake:
 //       [3]=num_inspectors (uint64 as bytes)
 method_begin_verification:
     // Only admin
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
+    callsub assert_admin
 
     // Evidence box must exist
     txna ApplicationArgs 1
@@ -533,37 +556,31 @@ method_begin_verification:
     // Build verification value:
     // window_end|num_inspectors|commit_count|reveal_count|finalized
     txna ApplicationArgs 2    // window_end timestamp
-    byte "|"
+    bytec_0 // "|"
     concat
     txna ApplicationArgs 3    // num_inspectors
-    byte "|"
+    bytec_0 // "|"
     concat
     concat
-    int 0                     // commit_count
+    intc_0                     // commit_count
     itob
-    byte "|"
+    bytec_0 // "|"
     concat
     concat
-    int 0                     // reveal_count
+    intc_0                     // reveal_count
     itob
-    byte "|"
+    bytec_0 // "|"
     concat
     concat
-    int 0                     // finalized = false
+    intc_0                     // finalized = false
     itob
     concat
     store 11  // vrf value
 
-    // Create verification box
-    load 10
-    int 2048
-    box_create
-    pop
-
+    // Create verification box sized to its value
     load 10
-    int 0
     load 11
-    box_replace
+    box_put
 
     // Log
     byte "verification_started:"
@@ -571,12 +588,14 @@ method_begin_verification:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == commit_verdict ===============================
 // Inspector submits hash(verdict + nonce) -- commit phase of commit-reveal.
-// Stored in inspector-specific box: "CMT-" + evidence_counter + sender_address
+// Stored in inspector-specific box: "INS-" + evidence_counter + sender_address
+// Box layout (113 bytes): phase(1) | commit_hash(32) | verdict(8) |
+//                         revealed_at(8) | justification_ipfs(<=64, zero-padded)
 // Args: [0]="commit_verdict", [1]=evidence_box_key, [2]=commit_hash (32 bytes)
 method_commit_verdict:
     // Evidence box must exist
@@ -585,24 +604,33 @@ method_commit_verdict:
     assert
     pop
 
-    // Build commit box key: "CMT-" + counter + sender
-    byte "CMT-"
+    txna ApplicationArgs 2
+    len
+    int 32
+    ==
+    assert
+
+    // Build inspector box key: "INS-" + counter + sender
+    byte "INS-"
     txna ApplicationArgs 1
     extract 4 8
     concat
     txn Sender
     concat
-    store 12  // commit box key
+    store 12  // inspector box key
 
-    // Store commit hash
+    // box_create returns 0 if the box already exists: one commit only
     load 12
-    int 64
+    int 113
     box_create
-    pop
+    assert
 
+    // phase = 0 (committed) followed by the commit hash
     load 12
-    int 0
+    intc_0
+    byte 0x00
     txna ApplicationArgs 2   // 32-byte commit hash
+    concat
     box_replace
 
     // Log
@@ -611,15 +639,16 @@ method_commit_verdict:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == reveal_verdict ===============================
 // Inspector reveals their verdict + nonce. Contract verifies hash matches commit.
+// The reveal is written into the same "INS-" box as the commit.
 // Args: [0]="reveal_verdict", [1]=evidence_box_key,
 //       [2]=verdict (uint64 as bytes: 1=authentic, 2=fake, 3=inconclusive),
 //       [3]=nonce (arbitrary bytes),
-//       [4]=justification_ipfs_hash (proof uploaded by inspector)
+//       [4]=justification_ipfs_hash (proof uploaded by inspector, <= 64 bytes)
 method_reveal_verdict:
     // Evidence box must exist
     txna ApplicationArgs 1
@@ -627,19 +656,39 @@ method_reveal_verdict:
     assert
     pop
 
-    // Build commit box key to verify
-    byte "CMT-"
+    txna ApplicationArgs 2
+    len
+    int 8
+    ==
+    assert
+
+    txna ApplicationArgs 4
+    len
+    int 64
+    <=
+    assert
+
+    // Build inspector box key: "INS-" + counter + sender
+    byte "INS-"
     txna ApplicationArgs 1
     extract 4 8
     concat
     txn Sender
     concat
-    store 13  // commit box key
+    store 13  // inspector box key
 
-    // Commit must exist
+    // Commit must exist (box_extract fails on a missing box) and not
+    // be revealed yet: phase byte 0 (committed), then the commit hash
     load 13
-    box_get
+    intc_0
+    int 33
+    box_extract
+    dup
+    extract 0 1
+    byte 0x00                 // INSPECTOR_PHASE_COMMITTED
+    ==
     assert
+    extract 1 32
     store 14  // stored commit hash
 
     // Verify: SHA256(verdict + nonce) == stored commit hash
@@ -648,44 +697,22 @@ method_reveal_verdict:
     concat
     sha256
     load 14
-    extract 0 32              // first 32 bytes of stored commit
     ==
     assert
 
-    // Build reveal box: "RVL-" + counter + sender
-    byte "RVL-"
-    txna ApplicationArgs 1
-    extract 4 8
-    concat
-    txn Sender
+    // phase = 1 (revealed), keep commit hash, then verdict|revealed_at|ipfs
+    load 13
+    intc_0
+    byte 0x01
+    load 14
     concat
-    store 15  // reveal box key
-
-    // Store: verdict|justification_ipfs|timestamp|sender
     txna ApplicationArgs 2    // verdict
-    byte "|"
-    concat
-    txna ApplicationArgs 4    // justification IPFS hash
-    byte "|"
-    concat
     concat
     global LatestTimestamp
     itob
-    byte "|"
-    concat
     concat
-    txn Sender
+    txna ApplicationArgs 4    // justification IPFS hash
     concat
-    store 16  // reveal value
-
-    load 15
-    int 512
-    box_create
-    pop
-
-    load 15
-    int 0
-    load 16
     box_replace
 
     // Log
@@ -694,45 +721,36 @@ method_reveal_verdict:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == finalize_verification ========================
 // Admin-only: tallies verdicts, updates evidence status to VERIFIED or REJECTED.
 // Args: [0]="finalize_verification", [1]=evidence_box_key,
-//       [2]=new_evidence_blob (full updated evidence metadata)
+//       [2]=final_status (uint64 STATUS_* code)
 //       [3]=final_status_label (for logging)
 method_finalize_verification:
     // Only admin
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
+    callsub assert_admin
 
-    // Evidence box must exist
+    // Write the final status into the box header
     txna ApplicationArgs 1
-    box_get
-    assert
-    pop
-
-    // Overwrite evidence box with new blob (includes updated status)
-    txna ApplicationArgs 1
-    int 0
+    int 41                   // status offset
     txna ApplicationArgs 2
+    callsub assert_uint64_arg
     box_replace
 
     // Log final result
     byte "verification_finalized:"
     txna ApplicationArgs 3    // status label
-    byte "|"
+    bytec_0 // "|"
     concat
     txna ApplicationArgs 1    // evidence key
     concat
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == resolve_evidence (Step 4) ====================
@@ -744,20 +762,13 @@ method_finalize_verification:
 //       [2]=resolution_status (1=VERIFIED, 3=REJECTED),
 //       [3]=refund_address (submitter address for stake return),
 //       [4]=stake_amount (uint64 as bytes),
-//       [5]=updated_evidence_blob (full metadata with RESOLVED status)
+//       [5]=new_status (uint64 STATUS_* code, normally RESOLVED)
 method_resolve_evidence:
     // Only admin (contract executor — acts automatically, not manually)
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
+    callsub assert_admin
 
-    // Evidence box must exist
-    txna ApplicationArgs 1
-    box_get
-    assert
-    pop
+    // No existence probe: both branches box_replace the evidence box, which
+    // fails (and reverts the inner payment) if it does not exist.
 
     // Check resolution type
     txna ApplicationArgs 2
@@ -766,7 +777,7 @@ method_resolve_evidence:
 
     // Branch: VERIFIED (status=1) -> refund stake
     load 20
-    int 1
+    intc_1
     ==
     bnz resolve_verified
 
@@ -789,14 +800,19 @@ resolve_verified:
         txna ApplicationArgs 4    // stake amount
         btoi
         itxn_field Amount
-        int 0
+        intc_0
         itxn_field Fee
     itxn_submit
 
-    // Update evidence box with resolved metadata
+    // Record status and STAKE_REFUNDED in the box header
+    txna ApplicationArgs 1
+    int 41                       // status offset
+    txna ApplicationArgs 5       // new status
+    callsub assert_uint64_arg
+    box_replace
     txna ApplicationArgs 1
-    int 0
-    txna ApplicationArgs 5       // updated evidence blob
+    int 57                       // stake_status offset
+    byte 0x01                    // STAKE_REFUNDED
     box_replace
 
     // Log resolution
@@ -805,24 +821,29 @@ resolve_verified:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 resolve_rejected:
     // Forfeit stake — funds remain in contract permanently
     // Update total_forfeited counter
-    byte "total_forfeited"
-    byte "total_forfeited"
+    bytec_2 // "total_forfeited"
+    dup
     app_global_get
     txna ApplicationArgs 4       // stake amount
     btoi
     +
     app_global_put
 
-    // Update evidence box with rejected metadata
+    // Record status and STAKE_FORFEITED in the box header
     txna ApplicationArgs 1
-    int 0
-    txna ApplicationArgs 5       // updated evidence blob
+    int 41                       // status offset
+    txna ApplicationArgs 5       // new status
+    callsub assert_uint64_arg
+    box_replace
+    txna ApplicationArgs 1
+    int 57                       // stake_status offset
+    byte 0x02                    // STAKE_FORFEITED
     box_replace
 
     // Log rejection
@@ -831,7 +852,7 @@ resolve_rejected:
     concat
     log
 
-    int 1
+    intc_1
     return
 
 // == publish_evidence (Step 5) ====================
@@ -841,26 +862,17 @@ resolve_rejected:
 // Anyone can independently verify the entire evidence lifecycle.
 // No further actions or fund movements occur after this step.
 // Args: [0]="publish_evidence", [1]=evidence_box_key,
-//       [2]=updated_evidence_blob (full metadata with PUBLISHED status),
+//       [2]=new_status (uint64, STATUS_PUBLISHED),
 //       [3]=audit_summary (JSON metadata: timestamps, verdicts, resolution)
 method_publish_evidence:
     // Only admin
-    byte "admin"
-    app_global_get
-    txn Sender
-    ==
-    assert
-
-    // Evidence box must exist
-    txna ApplicationArgs 1
-    box_get
-    assert
-    pop
+    callsub assert_admin
 
-    // Update evidence box with PUBLISHED status
+    // Write PUBLISHED status into the box header
     txna ApplicationArgs 1
-    int 0
-    txna ApplicationArgs 2       // updated evidence blob (PUBLISHED)
+    int 41                       // status offset
+    txna ApplicationArgs 2       // new status (PUBLISHED)
+    callsub assert_uint64_arg
     box_replace
 
     // Create audit trail box: "AUD-" + evidence_counter
@@ -872,14 +884,8 @@ method_publish_evidence:
 
     // Create audit box and store the full audit summary
     load 21
-    int 4096                     // generous size for audit JSON
-    box_create
-    pop
-
-    load 21
-    int 0
     txna ApplicationArgs 3      // audit summary JSON
-    box_replace
+    box_put
 
     // Log publication
     byte "published:PUBLIC|audit_recorded|"
@@ -887,8 +893,29 @@ method_publish_evidence:
     concat
     log
 
-    int 1
+    intc_1
     return
+
+// == assert_admin (subroutine) ====================
+// Fails the program unless the sender is the stored admin.
+assert_admin:
+    bytec_3 // "admin"
+    app_global_get
+    txn Sender
+    ==
+    assert
+    retsub
+
+// == assert_uint64_arg (subroutine) ===============
+// Fails unless the value on top of the stack is exactly 8 bytes, so a
+// status write can never spill past the header's status field.
+assert_uint64_arg:
+    dup
+    len
+    int 8
+    ==
+    assert
+    retsub
 """
 
 CLEAR_TEAL = """
@@ -897,27 +924,55 @@ int 1
 return
 """
 
+APPROVAL_TEAL_STRIPPED = APPROVAL_TEAL.strip()
+CLEAR_TEAL_STRIPPED = CLEAR_TEAL.strip()
+
+# SHA-512/256 state with the "appID" domain prefix already absorbed
+_APP_ADDRESS_HASHER = hashlib.new("sha512_256", b"appID")
+
+# Compiled bytecode keyed by SHA-256 of the TEAL source
+_compiled_teal_cache: dict[bytes, bytes] = {}
+
 
 def get_approval_teal() -> str:
     """Return the approval program TEAL source."""
-    return APPROVAL_TEAL.strip()
+    return APPROVAL_TEAL_STRIPPED
 
 
 def get_clear_teal() -> str:
     """Return the clear state program TEAL source."""
-    return CLEAR_TEAL.strip()
+    return CLEAR_TEAL_STRIPPED
 
 
 def compile_teal(algod_client, teal_source: str) -> bytes:
-    """Compile TEAL source to bytecode via algod."""
-    result = algod_client.compile(teal_source)
-    return encoding.base64.b64decode(result["result"])
+    """Compile TEAL source to bytecode via algod (once per distinct source)."""
+    key = hashlib.sha256(teal_source.encode("utf-8")).digest()
+    program = _compiled_teal_cache.get(key)
+    if program is None:
+        result = algod_client.compile(teal_source)
+        program = a2b_base64(result["result"])
+        _compiled_teal_cache[key] = program
+    return program
+
+
+# [year_starts_at, next_year_starts_at, "YYYY"] in local time
+_YEAR_CACHE = [0.0, 0.0, ""]
+
+
+def current_year() -> str:
+    """Return the local year as a string, re-read only when it changes."""
+    now = time.time()
+    if not _YEAR_CACHE[0] <= now < _YEAR_CACHE[1]:
+        year = time.localtime(now).tm_year
+        _YEAR_CACHE[0] = time.mktime((year, 1, 1, 0, 0, 0, 0, 0, -1))
+        _YEAR_CACHE[1] = time.mktime((year + 1, 1, 1, 0, 0, 0, 0, 0, -1))
+        _YEAR_CACHE[2] = str(year)
+    return _YEAR_CACHE[2]
 
 
 def format_evidence_id(counter: int) -> str:
     """Format evidence counter into human-readable ID."""
-    year = time.strftime("%Y")
-    return f"EVD-{year}-{counter:05d}"
+    return f"EVD-{current_year()}-{counter:05d}"
 
 
 def make_box_key(counter: int) -> bytes:
@@ -925,40 +980,242 @@ def make_box_key(counter: int) -> bytes:
     return b"EVD-" + counter.to_bytes(8, "big")
 
 
+def make_box_keys(counters) -> list[bytes]:
+    """Create evidence box keys for many counters at once."""
+    n = len(counters)
+    raw = struct.pack(f">{n}Q", *counters)
+    return [b"EVD-" + raw[i:i + 8] for i in range(0, n * 8, 8)]
+
+
+@functools.lru_cache(maxsize=1024)
 def get_application_address(app_id: int) -> str:
     """Compute the Algorand application account address."""
     # The app address is SHA512-256 of b"appID" + app_id_bytes
-    import hashlib
-    addr_bytes = hashlib.new(
-        "sha512_256", b"appID" + app_id.to_bytes(8, "big")
-    ).digest()
-    return encoding.encode_address(addr_bytes)
+    h = _APP_ADDRESS_HASHER.copy()
+    h.update(app_id.to_bytes(8, "big"))
+    return encoding.encode_address(h.digest())
+
+
+def _pack_fields_into(buf: bytearray, offset: int, fields: Sequence[bytes]) -> None:
+    """Write length-prefixed fields into buf starting at offset."""
+    mv = memoryview(buf)
+    for data in fields:
+        _FIELD_LEN.pack_into(buf, offset, len(data))
+        offset += _FIELD_LEN.size
+        mv[offset:offset + len(data)] = data
+        offset += len(data)
+
+
+def pack_box_value(fields: Sequence[bytes], header_size: int = 0) -> bytearray:
+    """
+    Lay out length-prefixed fields in one preallocated buffer.
+
+    The first header_size bytes are left zeroed for the caller to fill
+    (e.g. with _EVIDENCE_BOX_HEADER.pack_into), so a full box value is
+    built without intermediate part lists or concatenation copies.
+    """
+    for data in fields:
+        if len(data) > 0xFFFF:
+            raise ValueError("box field longer than 65535 bytes")
+    buf = bytearray(header_size + sum(_FIELD_LEN.size + len(d) for d in fields))
+    _pack_fields_into(buf, header_size, fields)
+    return buf
+
+
+def encode_evidence_fields(ipfs_hash: str, organization: str, description: str) -> bytes:
+    """Encode the length-prefixed text fields passed as submit_evidence arg 1."""
+    return bytes(pack_box_value((
+        ipfs_hash.encode("utf-8"),
+        organization.encode("utf-8"),
+        description.encode("utf-8"),
+    )))
+
+
+def build_evidence_box(
+    ipfs_hash: str,
+    category: int,
+    organization: str,
+    description: str,
+    submitter: str,
+    timestamp: int,
+    stake_amount: int,
+    status: int = STATUS_PENDING,
+    stake_status: int = STAKE_LOCKED,
+) -> bytes:
+    """Encode evidence metadata in the packed box format written on-chain."""
+    buf = pack_box_value(
+        (
+            ipfs_hash.encode("utf-8"),
+            organization.encode("utf-8"),
+            description.encode("utf-8"),
+        ),
+        header_size=_EVIDENCE_BOX_HEADER.size,
+    )
+    _EVIDENCE_BOX_HEADER.pack_into(
+        buf,
+        0,
+        EVIDENCE_BOX_VERSION,
+        encoding.decode_address(submitter),
+        timestamp,
+        status,
+        stake_amount,
+        stake_status,
+        category,
+    )
+    return bytes(buf)
+
+
+def _unpack_evidence_fields(raw_bytes: bytes) -> list[str]:
+    """Decode the three length-prefixed text fields after the header."""
+    mv = memoryview(raw_bytes)
+    offset = _EVIDENCE_BOX_HEADER.size
+    fields = []
+    for _ in range(3):
+        (length,) = _FIELD_LEN.unpack_from(raw_bytes, offset)
+        offset += _FIELD_LEN.size
+        fields.append(str(mv[offset:offset + length], "utf-8", "replace"))
+        offset += length
+    return fields
+
+
+def _parse_binary_evidence_box(raw_bytes: bytes) -> dict:
+    """Parse a version-2 packed evidence box value."""
+    (
+        _version, submitter, timestamp, status,
+        stake_amount, stake_status, category,
+    ) = _EVIDENCE_BOX_HEADER.unpack_from(raw_bytes)
+
+    fields = _unpack_evidence_fields(raw_bytes)
+    return {
+        "ipfs_hash": fields[0],
+        "category": (
+            CATEGORY_LABELS[category] if category < len(CATEGORY_LABELS) else str(category)
+        ),
+        "organization": fields[1],
+        "description": fields[2],
+        "submitter": encoding.encode_address(submitter),
+        "timestamp": timestamp,
+        "status": status,
+        "stake_amount": str(stake_amount),
+        "stake_status": stake_status,
+    }
 
 
 def parse_evidence_box(raw_bytes: bytes) -> dict:
-    """Parse a pipe-delimited evidence box value into a dict."""
-    parts = raw_bytes.split(b"|")
-    if len(parts) < 8:
+    """
+    Parse an evidence box value into a dict.
+
+    Handles the packed version-2 format and the legacy pipe-delimited one.
+    Results are cached by box content; callers get their own copy.
+    """
+    return dict(_parse_evidence_box_cached(bytes(raw_bytes)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_evidence_box_cached(raw_bytes: bytes) -> dict:
+    if raw_bytes[:1] == b"\x02" and len(raw_bytes) >= _EVIDENCE_BOX_HEADER.size:
+        try:
+            return _parse_binary_evidence_box(raw_bytes)
+        except struct.error:
+            # Text fields are encoded by the submitter and may be malformed
+            return {"raw": raw_bytes.hex()}
+
+    # Locate up to 9 field boundaries in one scan; fields stay memoryview
+    # slices until decoded, so no intermediate list of copies is built.
+    bounds = []
+    find = raw_bytes.find
+    start = 0
+    for _ in range(9):
+        end = find(b"|", start)
+        if end < 0:
+            bounds.append((start, len(raw_bytes)))
+            break
+        bounds.append((start, end))
+        start = end + 1
+
+    if len(bounds) < 8:
         return {"raw": raw_bytes.hex()}
 
+    mv = memoryview(raw_bytes)
+
+    def text(i: int) -> str:
+        a, b = bounds[i]
+        return str(mv[a:b], "utf-8", "replace")
+
+    def uint64(i: int) -> int:
+        a, b = bounds[i]
+        return int.from_bytes(mv[a:a + 8], "big") if b - a >= 8 else 0
+
+    sub_a, sub_b = bounds[4]
     result = {
-        "ipfs_hash": parts[0].decode("utf-8", errors="replace"),
-        "category": parts[1].decode("utf-8", errors="replace"),
-        "organization": parts[2].decode("utf-8", errors="replace"),
-        "description": parts[3].decode("utf-8", errors="replace"),
-        "submitter": encoding.encode_address(parts[4]) if len(parts[4]) == 32 else parts[4].decode("utf-8", errors="replace"),
-        "timestamp": int.from_bytes(parts[5][:8], "big") if len(parts[5]) >= 8 else 0,
-        "status": int.from_bytes(parts[6][:8], "big") if len(parts[6]) >= 8 else 0,
-        "stake_amount": parts[7].decode("utf-8", errors="replace"),
+        "ipfs_hash": text(0),
+        "category": text(1),
+        "organization": text(2),
+        "description": text(3),
+        "submitter": encoding.encode_address(raw_bytes[sub_a:sub_b]) if sub_b - sub_a == 32 else text(4),
+        "timestamp": uint64(5),
+        "status": uint64(6),
+        "stake_amount": text(7),
+        # stake_status is the optional 9th field
+        "stake_status": uint64(8) if len(bounds) >= 9 else 0,
     }
 
-    # Parse stake_status if present (9th field)
-    if len(parts) >= 9:
+    return result
+
+
+def parse_evidence_batch(raws: list[bytes]) -> tuple["np.ndarray", list[dict]]:
+    """
+    Parse many version-2 evidence boxes at once.
+
+    The fixed headers are decoded with a single np.frombuffer call into a
+    structured array (one row per box, fields as in _HEADER_DTYPE); only
+    the variable-length text fields are parsed per box. Returns the array
+    and a list of {"ipfs_hash", "organization", "description"} dicts.
+    """
+    if np is None:
+        raise RuntimeError("parse_evidence_batch requires numpy")
+    size = _EVIDENCE_BOX_HEADER.size
+    for raw in raws:
+        if raw[:1] != b"\x02" or len(raw) < size:
+            raise ValueError("parse_evidence_batch only accepts version-2 evidence boxes")
+
+    headers = np.frombuffer(b"".join(raw[:size] for raw in raws), dtype=_HEADER_DTYPE)
+    tails = []
+    for raw in raws:
         try:
-            result["stake_status"] = int.from_bytes(parts[8][:8], "big") if len(parts[8]) >= 8 else 0
+            ipfs_hash, organization, description = _unpack_evidence_fields(raw)
+        except struct.error:
+            tails.append({"raw": raw.hex()})
+            continue
+        tails.append({
+            "ipfs_hash": ipfs_hash,
+            "organization": organization,
+            "description": description,
+        })
+    return headers, tails
+
+
+def fetch_and_parse_evidence_batch(
+    algod_client,
+    app_id: int,
+    counters: list[int],
+    max_workers: int = 32,
+) -> list[dict | None]:
+    """
+    Read and parse many evidence boxes with concurrent algod requests.
+
+    At most max_workers box reads are in flight at once. Results follow
+    the order of counters; boxes that cannot be read come back as None.
+    """
+    def fetch(key: bytes) -> dict | None:
+        try:
+            box = algod_client.application_box_by_name(app_id, key)
         except Exception:
-            result["stake_status"] = 0
-    else:
-        result["stake_status"] = 0
-
-    return result
+            return None
+        return parse_evidence_box(a2b_base64(box["value"]))
+
+    keys = make_box_keys(counters)
+    if not keys:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+        return list(pool.map(fetch, keys))
@@ -9,9 +9,21 @@ AlgoKit is Algorand's official development toolkit:
 """
 
 import os
+import re
 import sys
 import json
-import base64
+import hashlib
+import shutil
+import subprocess
+import tempfile
+from binascii import a2b_base64
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # Optional: faster JSON for contract_ids.json
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root AND smart-contracts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -38,6 +50,17 @@ from contracts.evidence_registry import (
 
 load_dotenv()
 
+# Compiled bytecode cache: <cache>/whistlechain/<sha256 of source>.tok
+TEAL_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME")
+    or os.getenv("LOCALAPPDATA")
+    or os.path.join(os.path.expanduser("~"), ".cache"),
+    "whistlechain",
+)
+
+# One EVIDENCE_REGISTRY_APP_ID=... line in .env (anchored per line)
+_ENV_APP_ID_RE = re.compile(rb"(?m)^EVIDENCE_REGISTRY_APP_ID=[^\r\n]*")
+
 
 def get_algorand_client() -> AlgorandClient:
     """
@@ -57,7 +80,59 @@ def get_algod_client() -> algod.AlgodClient:
 def compile_teal(client: algod.AlgodClient, source: str) -> bytes:
     """Compile TEAL source to bytecode."""
     result = client.compile(source)
-    return base64.b64decode(result["result"])
+    return a2b_base64(result["result"])
+
+
+def compile_teal_local(source: str, client: algod.AlgodClient | None = None) -> bytes:
+    """
+    Assemble TEAL with a local `goal clerk compile` (no node needed).
+
+    Falls back to the algod compile endpoint when goal isn't on PATH or
+    fails, so public-node rate limits only matter without a local toolchain.
+    """
+    goal = shutil.which("goal")
+    if goal is not None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src_path = os.path.join(tmp_dir, "program.teal")
+            out_path = src_path + ".tok"
+            with open(src_path, "w") as f:
+                f.write(source)
+            proc = subprocess.run(
+                [goal, "clerk", "compile", src_path, "-o", out_path],
+                capture_output=True,
+            )
+            if proc.returncode == 0 and os.path.exists(out_path):
+                with open(out_path, "rb") as f:
+                    return f.read()
+
+    if client is None:
+        raise RuntimeError("goal is not available and no algod client was given")
+    return compile_teal(client, source)
+
+
+def compile_teal_cached(source: str, client: algod.AlgodClient | None = None) -> bytes:
+    """
+    Return bytecode for source from the on-disk cache, compiling on a miss.
+
+    Entries are keyed by the SHA-256 of the TEAL source, so any contract
+    change misses the cache and repeat deploys of the same source skip
+    compilation entirely.
+    """
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    path = os.path.join(TEAL_CACHE_DIR, f"{key}.tok")
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    program = compile_teal_local(source, client)
+    try:
+        os.makedirs(TEAL_CACHE_DIR, exist_ok=True)
+        _write_atomic(path, program)
+    except OSError:
+        pass  # caching is best-effort
+    return program
 
 
 def deploy_evidence_registry(
@@ -81,17 +156,19 @@ def deploy_evidence_registry(
     deployer_address = account.address_from_private_key(deployer_private_key)
 
     print(f"  Deployer address : {deployer_address}")
-    print(f"  Compiling TEAL via AlgoKit...")
+    print(f"  Compiling TEAL (local goal, else algod)...")
 
-    # Compile TEAL using the algod client from AlgoKit
+    # Compile TEAL (disk cache, then local goal; AlgoKit's algod client is the fallback)
     algod_client = algorand.client.algod
     approval_teal = get_approval_teal()
     clear_teal = get_clear_teal()
 
-    approval_result = algod_client.compile(approval_teal)
-    clear_result = algod_client.compile(clear_teal)
-    approval_program = base64.b64decode(approval_result["result"])
-    clear_program = base64.b64decode(clear_result["result"])
+    # Both compiles are independent network round trips; run them together
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        approval_future = pool.submit(compile_teal_cached, approval_teal, algod_client)
+        clear_future = pool.submit(compile_teal_cached, clear_teal, algod_client)
+        approval_program = approval_future.result()
+        clear_program = clear_future.result()
 
     print(f"  Approval program : {len(approval_program)} bytes")
     print(f"  Clear program    : {len(clear_program)} bytes")
@@ -143,14 +220,44 @@ def fund_account_if_needed(algorand: AlgorandClient, address: str) -> None:
         print(f"  ⚠️  Could not check balance: {e}")
 
 
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Write data to path via a temp file + os.replace (no partial files).
+
+    The temp file is unique per call and keeps the mode of the file it
+    replaces, so a 0600 .env stays 0600 after a deploy.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            # mkstemp creates 0600; give new files the usual umask mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_contract_id(app_id: int, contract_name: str = "evidence_registry") -> None:
     """Save deployed contract App ID to contract_ids.json."""
     ids_path = os.path.join(os.path.dirname(__file__), "contract_ids.json")
 
     # Load existing IDs
     if os.path.exists(ids_path):
-        with open(ids_path, "r") as f:
-            ids = json.load(f)
+        with open(ids_path, "rb") as f:
+            raw = f.read()
+        ids = orjson.loads(raw) if orjson is not None else json.loads(raw)
     else:
         ids = {}
 
@@ -159,8 +266,11 @@ def save_contract_id(app_id: int, contract_name: str = "evidence_registry") -> N
         "network": "testnet",
     }
 
-    with open(ids_path, "w") as f:
-        json.dump(ids, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(ids, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(ids, indent=2).encode("utf-8")
+    _write_atomic(ids_path, data)
 
     print(f"  Saved to         : {ids_path}")
 
@@ -221,22 +331,17 @@ def update_env_app_id(env_path: str, app_id: int) -> None:
     if not os.path.exists(env_path):
         return
 
-    with open(env_path, "r") as f:
-        content = f.read()
+    with open(env_path, "rb") as f:
+        original = f.read()
 
     # Replace or append EVIDENCE_REGISTRY_APP_ID
-    if "EVIDENCE_REGISTRY_APP_ID" in content:
-        import re
-        content = re.sub(
-            r"EVIDENCE_REGISTRY_APP_ID=.*",
-            f"EVIDENCE_REGISTRY_APP_ID={app_id}",
-            content,
-        )
-    else:
-        content += f"\nEVIDENCE_REGISTRY_APP_ID={app_id}\n"
+    line = f"EVIDENCE_REGISTRY_APP_ID={app_id}".encode()
+    content, n = _ENV_APP_ID_RE.subn(line, original)
+    if n == 0:
+        content = original + b"\n" + line + b"\n"
 
-    with open(env_path, "w") as f:
-        f.write(content)
+    if content != original:
+        _write_atomic(env_path, content)
 
     print(f"  Updated .env     : EVIDENCE_REGISTRY_APP_ID={app_id}")
 
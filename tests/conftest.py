@@ -0,0 +1,131 @@
+"""
+Shared pytest fixtures for the WhistleChain test suite.
+
+The suite is process-parallel safe (pip install -r requirements-dev.txt):
+    python -m pytest tests/ -n auto --dist loadgroup
+Testnet tests are grouped with xdist_group("network") so they share one
+worker and don't hit the public node concurrently.
+"""
+
+import os
+import re
+import sys
+import collections
+import importlib.util
+
+import pytest
+
+
+# Substrings the TEAL tests look for; scanned once by approval_tokens
+APPROVAL_TOKENS = (
+    "submit_evidence",
+    "update_status",
+    "get_evidence",
+    "evidence_counter",
+    "refund_stake",
+    "forfeit_stake",
+    '"total_staked"',
+    '"total_forfeited"',
+    '"admin"',
+    "itxn_begin",
+    "itxn_submit",
+    "assert_admin:",
+    "callsub assert_admin",
+    "gtxn 0 Receiver",
+    "min_stake_check:",
+    'byte "INS-"',
+    "CMT-",
+    "RVL-",
+)
+
+# Opcode sequences the TEAL tests look for, matched as whole opcodes with
+# comments and indentation stripped (one "; " between opcodes)
+APPROVAL_OP_SEQUENCES = (
+    "box_put",
+    "box_create; pop",
+    "box_create; assert",
+    "box_extract; dup; extract 0 1",
+)
+
+
+def pytest_configure(config):
+    # Provided by pytest-xdist; registered here too so plain runs don't warn
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all tests of a group on one xdist worker",
+    )
+
+
+def _evidence_registry():
+    """Return the contract module, loading it once (hyphenated dir, no package import)."""
+    mod = sys.modules.get("evidence_registry")
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "evidence_registry",
+            os.path.join(os.path.dirname(__file__), "..", "smart-contracts", "contracts", "evidence_registry.py"),
+        )
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules["evidence_registry"] = mod
+        spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """The contracts/evidence_registry.py module."""
+    return _evidence_registry()
+
+
+@pytest.fixture(scope="session")
+def approval_teal() -> str:
+    """Approval program TEAL source, built once per test session."""
+    return _evidence_registry().get_approval_teal()
+
+
+@pytest.fixture(scope="session")
+def approval_tokens(approval_teal) -> collections.Counter:
+    """
+    Occurrence counts of the TEAL test tokens, found in one regex pass.
+
+    Covers APPROVAL_TOKENS plus each method's selector push and label, the
+    inspector box size and the evidence header offsets. The lookahead keeps
+    matches zero-width so overlapping tokens ("callsub assert_admin" /
+    "assert_admin:") all count. APPROVAL_OP_SEQUENCES and the inspector
+    phase check are counted the same way over the opcode stream, so
+    comments and formatting don't matter.
+    """
+    er = _evidence_registry()
+    tokens = set(APPROVAL_TOKENS)
+    for name, selector in er.METHOD_SELECTORS.items():
+        tokens.add(f"byte 0x{selector.hex()}")
+        tokens.add(f"method_{name}")
+    tokens.add(f"int {er.INSPECTOR_BOX_SIZE}")
+    tokens.add(f"int {er.EVIDENCE_STATUS_OFFSET}")
+    tokens.add(f"int {er.EVIDENCE_STAKE_STATUS_OFFSET}")
+    sequences = APPROVAL_OP_SEQUENCES + (
+        f"extract 0 1; byte 0x{er.INSPECTOR_PHASE_COMMITTED:02x}; ==; assert",
+    )
+
+    alternation = "|".join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+    pattern = re.compile(f"(?=({alternation}))")
+    counts = collections.Counter(m.group(1) for m in pattern.finditer(approval_teal))
+
+    ops = (" ".join(line.split("//")[0].split()) for line in approval_teal.splitlines())
+    stream = "; " + "; ".join(op for op in ops if op) + "; "
+    alternation = "|".join(re.escape(f"; {seq}; ") for seq in sequences)
+    pattern = re.compile(f"(?=({alternation}))")
+    counts.update(m.group(1)[2:-2] for m in pattern.finditer(stream))
+    return counts
+
+
+@pytest.fixture(scope="session")
+def clear_teal() -> str:
+    """Clear program TEAL source, built once per test session."""
+    return _evidence_registry().get_clear_teal()
+
+
+@pytest.fixture(scope="session")
+def any_wallet() -> dict:
+    """One anonymous wallet shared by tests that don't need a fresh one."""
+    from backend.services.wallet import create_anonymous_wallet
+    return create_anonymous_wallet()
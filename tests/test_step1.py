@@ -11,7 +11,8 @@ Run:
 import os
 import sys
 import json
-import tempfile
+
+import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
@@ -26,6 +27,8 @@ from backend.services.encryption import (
     encrypt_bytes,
     decrypt_file,
     encrypt_files_to_bundle,
+    encrypt_files_to_bundle_fast,
+    encrypt_files_to_bundle_stream,
     decrypt_bundle,
     key_to_hex,
     key_from_hex,
@@ -36,24 +39,23 @@ from backend.services.algorand_client import get_algod_client
 class TestWalletGeneration:
     """Test anonymous wallet creation."""
 
-    def test_create_wallet(self):
-        wallet = create_anonymous_wallet()
+    def test_create_wallet(self, any_wallet):
+        wallet = any_wallet
         assert "address" in wallet
         assert "private_key" in wallet
         assert "mnemonic" in wallet
         assert len(wallet["address"]) == 58  # Algorand address length
         assert len(wallet["mnemonic"].split()) == 25  # 25-word mnemonic
 
-    def test_wallet_restore_from_mnemonic(self):
-        wallet1 = create_anonymous_wallet()
+    def test_wallet_restore_from_mnemonic(self, any_wallet):
+        wallet1 = any_wallet
         wallet2 = wallet_from_mnemonic(wallet1["mnemonic"])
         assert wallet1["address"] == wallet2["address"]
         assert wallet1["private_key"] == wallet2["private_key"]
 
-    def test_address_from_private_key(self):
-        wallet = create_anonymous_wallet()
-        addr = get_address_from_private_key(wallet["private_key"])
-        assert addr == wallet["address"]
+    def test_address_from_private_key(self, any_wallet):
+        addr = get_address_from_private_key(any_wallet["private_key"])
+        assert addr == any_wallet["address"]
 
     def test_unique_wallets(self):
         w1 = create_anonymous_wallet()
@@ -81,17 +83,18 @@ class TestEncryption:
         decrypted = decrypt_file(ciphertext, key, nonce, tag)
         assert decrypted == plaintext
 
-    def test_encrypt_decrypt_file_bundle(self):
+    def test_encrypt_decrypt_file_bundle(self, tmp_path):
         key = generate_encryption_key()
 
         # Create temp files
-        tmp_dir = tempfile.mkdtemp()
+        contents = {}
         files = []
         for i in range(3):
-            fp = os.path.join(tmp_dir, f"evidence_{i}.txt")
-            with open(fp, "w") as f:
-                f.write(f"Evidence document #{i}: fraud detected in contract {i*1000}")
-            files.append(fp)
+            p = tmp_path / f"evidence_{i}.txt"
+            data = f"Evidence document #{i}: fraud detected in contract {i*1000}".encode()
+            p.write_bytes(data)
+            contents[p.name] = data
+            files.append(str(p))
 
         # Encrypt
         bundle = encrypt_files_to_bundle(files, key)
@@ -101,16 +104,65 @@ class TestEncryption:
         recovered = decrypt_bundle(bundle, key)
         assert len(recovered) == 3
 
-        for i, fp in enumerate(files):
-            filename = os.path.basename(fp)
-            assert filename in recovered
-            with open(fp, "rb") as f:
-                assert recovered[filename] == f.read()
+        assert recovered == contents
+
+    def test_encrypt_decrypt_fast_bundle(self, tmp_path):
+        key = generate_encryption_key()
+
+        contents = {}
+        files = []
+        for i in range(3):
+            p = tmp_path / f"evidence_{i}.txt"
+            data = f"Evidence document #{i}: fraud detected in contract {i*1000}".encode()
+            p.write_bytes(data)
+            contents[p.name] = data
+            files.append(str(p))
+
+        bundle = encrypt_files_to_bundle_fast(files, key)
+        assert bundle.startswith(b"WCB2")
+
+        recovered = decrypt_bundle(bundle, key)
+        assert recovered == contents
+
+        # Tampering with the ciphertext must fail authentication
+        tampered = bytearray(bundle)
+        tampered[-20] ^= 0xFF
+        try:
+            decrypt_bundle(bytes(tampered), key)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    def test_encrypt_stream_bundle(self, tmp_path):
+        key = generate_encryption_key()
+
+        fp = tmp_path / "evidence.bin"
+        payload = os.urandom(200_000)
+        fp.write_bytes(payload)
+
+        chunks = list(encrypt_files_to_bundle_stream([str(fp)], key, chunk_size=4096))
+        assert len(chunks) > 2
+        bundle = b"".join(chunks)
+        assert bundle.startswith(b"WCB2")
+        assert decrypt_bundle(bundle, key) == {"evidence.bin": payload}
 
-        # Cleanup
-        for fp in files:
-            os.unlink(fp)
-        os.rmdir(tmp_dir)
+    def test_stream_bundle_rejects_size_change(self, tmp_path):
+        key = generate_encryption_key()
+        fp = tmp_path / "evidence.bin"
+        fp.write_bytes(os.urandom(10_000))
+
+        chunks = encrypt_files_to_bundle_stream([str(fp)], key, chunk_size=4096)
+        next(chunks)  # header; the file size is already fixed by now
+        with open(fp, "ab") as f:
+            f.write(b"late write")
+        with pytest.raises(ValueError, match="grew"):
+            list(chunks)
+
+        chunks = encrypt_files_to_bundle_stream([str(fp)], key, chunk_size=4096)
+        next(chunks)
+        fp.write_bytes(b"short")
+        with pytest.raises(ValueError, match="shrank"):
+            list(chunks)
 
     def test_key_hex_conversion(self):
         key = generate_encryption_key()
@@ -132,6 +184,39 @@ class TestEncryption:
             pass  # Expected — wrong key
 
 
+class TestIPFSUpload:
+    """Test the streamed Pinata upload request (no network)."""
+
+    def test_stream_upload_request(self, monkeypatch):
+        from backend.services import ipfs_upload
+
+        sent = {}
+
+        class _Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"IpfsHash": "QmStream"}
+
+        def fake_post(url, headers=None, data=None, timeout=None):
+            sent["body"] = b"".join(data)
+            sent["timeout"] = timeout
+            return _Response()
+
+        monkeypatch.setattr(ipfs_upload, "PINATA_JWT", "jwt")
+        monkeypatch.setattr(ipfs_upload.requests, "post", fake_post)
+
+        result = ipfs_upload.upload_stream_to_ipfs(
+            [b"abc", b"def"], filename='bad"name\r\nX-Injected: 1.bin'
+        )
+        assert result["IpfsHash"] == "QmStream"
+        assert sent["timeout"] == ipfs_upload.PINATA_TIMEOUT
+        assert b"\r\n\r\nabcdef\r\n" in sent["body"]
+        assert b'filename="bad%22name%0D%0AX-Injected: 1.bin"' in sent["body"]
+        assert b"\r\nX-Injected" not in sent["body"]
+
+
 class TestAlgorandConnection:
     """Test Algorand testnet connectivity."""
 
@@ -139,6 +224,7 @@ class TestAlgorandConnection:
         client = get_algod_client()
         assert client is not None
 
+    @pytest.mark.xdist_group("network")
     def test_testnet_connection(self):
         client = get_algod_client()
         try:
@@ -154,31 +240,21 @@ class TestAlgorandConnection:
 class TestEvidenceRegistryTEAL:
     """Test TEAL source generation."""
 
-    def _import_registry(self):
-        """Import from the smart-contracts dir (hyphen not valid for Python import)."""
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "evidence_registry",
-            os.path.join(os.path.dirname(__file__), "..", "smart-contracts", "contracts", "evidence_registry.py"),
-        )
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        return mod
-
-    def test_approval_teal_valid(self):
-        mod = self._import_registry()
-        teal = mod.get_approval_teal()
-        assert "#pragma version 10" in teal
-        assert "submit_evidence" in teal
-        assert "update_status" in teal
-        assert "get_evidence" in teal
-        assert "evidence_counter" in teal
-
-    def test_clear_teal_valid(self):
-        mod = self._import_registry()
-        teal = mod.get_clear_teal()
-        assert "#pragma version 10" in teal
-        assert "int 1" in teal
+    REQUIRED_APPROVAL_TOKENS = (
+        "submit_evidence",
+        "update_status",
+        "get_evidence",
+        "evidence_counter",
+    )
+
+    def test_approval_teal_valid(self, approval_teal, approval_tokens):
+        assert approval_teal.startswith("#pragma version 10")
+        missing = [t for t in self.REQUIRED_APPROVAL_TOKENS if t not in approval_tokens]
+        assert not missing
+
+    def test_clear_teal_valid(self, clear_teal):
+        assert "#pragma version 10" in clear_teal
+        assert "int 1" in clear_teal
 
 
 if __name__ == "__main__":
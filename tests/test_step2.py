@@ -31,6 +31,8 @@ from backend.submit_evidence import (
     validate_stake_amount,
     CATEGORIES,
     MIN_STAKE_MICROALGOS as SUBMIT_MIN_STAKES,
+    _batch_app_addresses,
+    get_application_address as submit_app_address,
 )
 
 # Import smart contract helpers
@@ -146,6 +148,19 @@ class TestApplicationAddress:
         expected_addr = encoding.encode_address(expected_bytes)
         assert get_application_address(app_id) == expected_addr
 
+    def test_batch_app_addresses(self):
+        """Batch helper matches the single-id computation, in order."""
+        app_ids = [0, 1, 42, 777, 2**64 - 1]
+        expected = [
+            encoding.encode_address(
+                hashlib.new("sha512_256", b"appID" + i.to_bytes(8, "big")).digest()
+            )
+            for i in app_ids
+        ]
+        assert _batch_app_addresses(app_ids) == expected
+        assert _batch_app_addresses([]) == []
+        assert submit_app_address(777) == expected[3]
+
     def test_contract_module_app_address(self):
         """Smart contract module has same get_application_address function."""
         addr1 = get_application_address(777)
@@ -158,53 +173,88 @@ class TestApplicationAddress:
 class TestSmartContractTEAL:
     """Test the updated TEAL program (v2 with staking)."""
 
-    def test_teal_has_stake_methods(self):
+    def test_teal_has_stake_methods(self, approval_tokens):
         """Updated TEAL includes refund_stake and forfeit_stake methods."""
-        teal = evidence_registry.get_approval_teal()
-        assert "refund_stake" in teal
-        assert "forfeit_stake" in teal
+        assert "refund_stake" in approval_tokens
+        assert "forfeit_stake" in approval_tokens
 
-    def test_teal_has_total_staked_global(self):
+    def test_teal_has_total_staked_global(self, approval_tokens):
         """TEAL initializes total_staked global state."""
-        teal = evidence_registry.get_approval_teal()
-        assert '"total_staked"' in teal
+        assert '"total_staked"' in approval_tokens
 
-    def test_teal_has_total_forfeited_global(self):
+    def test_teal_has_total_forfeited_global(self, approval_tokens):
         """TEAL initializes total_forfeited global state."""
-        teal = evidence_registry.get_approval_teal()
-        assert '"total_forfeited"' in teal
+        assert '"total_forfeited"' in approval_tokens
 
-    def test_teal_has_inner_txn_for_refund(self):
+    def test_teal_has_inner_txn_for_refund(self, approval_tokens):
         """Refund method uses inner transactions."""
-        teal = evidence_registry.get_approval_teal()
-        assert "itxn_begin" in teal
-        assert "itxn_submit" in teal
+        assert "itxn_begin" in approval_tokens
+        assert "itxn_submit" in approval_tokens
 
-    def test_teal_admin_only_refund(self):
+    def test_teal_admin_only_refund(self, approval_tokens):
         """Refund and forfeit methods check admin permission."""
-        teal = evidence_registry.get_approval_teal()
-        # Count admin checks -- should appear in handle_delete, handle_update,
-        # update_status, refund_stake, forfeit_stake (5 times)
-        admin_checks = teal.count('"admin"')
-        assert admin_checks >= 5
-
-    def test_teal_version_10(self):
+        # Admin checks go through one subroutine, called from handle_delete,
+        # handle_update and every admin-gated method (9 call sites)
+        assert "assert_admin:" in approval_tokens
+        assert '"admin"' in approval_tokens
+        admin_checks = approval_tokens["callsub assert_admin"]
+        assert admin_checks >= 9
+
+    def test_teal_version_10(self, approval_teal):
         """TEAL program uses version 10."""
-        teal = evidence_registry.get_approval_teal()
-        assert teal.startswith("#pragma version 10")
+        assert approval_teal.startswith("#pragma version 10")
 
-    def test_clear_teal_unchanged(self):
+    def test_clear_teal_unchanged(self, clear_teal):
         """Clear program is still simple return 1."""
-        clear = evidence_registry.get_clear_teal()
-        assert "int 1" in clear
-        assert "return" in clear
-
-    def test_box_value_includes_stake_status(self):
+        assert "int 1" in clear_teal
+        assert "return" in clear_teal
+
+    def test_teal_routes_by_method_selector(self, approval_tokens):
+        """Every method is dispatched by its 4-byte selector."""
+        for name, selector in evidence_registry.METHOD_SELECTORS.items():
+            assert len(selector) == 4
+            assert f"byte 0x{selector.hex()}" in approval_tokens, name
+            assert f"method_{name}" in approval_tokens
+
+    def test_teal_enforces_min_stake(self, approval_teal, approval_tokens):
+        """Grouped payment is checked on-chain against MIN_STAKE_BY_ID."""
+        block = next(l for l in approval_teal.splitlines() if l.startswith("intcblock"))
+        pooled = {int(v) for v in block.split()[1:]}
+        assert set(evidence_registry.MIN_STAKE_BY_ID) <= pooled
+        assert "gtxn 0 Receiver" in approval_tokens
+        assert "min_stake_check:" in approval_tokens
+
+    def test_teal_single_inspector_box(self, approval_tokens):
+        """Commit and reveal share one fixed-size INS- box per inspector."""
+        assert approval_tokens['byte "INS-"'] == 2
+        assert "CMT-" not in approval_tokens and "RVL-" not in approval_tokens
+        assert f"int {evidence_registry.INSPECTOR_BOX_SIZE}" in approval_tokens
+
+    def test_teal_boxes_sized_to_value(self, approval_tokens):
+        """Evidence, verification and audit boxes are box_put at exact size."""
+        assert approval_tokens["box_put"] == 3
+        assert approval_tokens["box_create; pop"] == 0
+
+    def test_teal_inspector_box_write_once(self, approval_tokens):
+        """A second commit fails, and reveal requires the committed phase."""
+        # commit: the only box_create, and its result must be 1 (new box)
+        assert approval_tokens["box_create; assert"] == 1
+        # reveal: one box_extract, then the phase byte is checked
+        committed = f"byte 0x{evidence_registry.INSPECTOR_PHASE_COMMITTED:02x}"
+        assert approval_tokens["box_extract; dup; extract 0 1"] == 1
+        assert approval_tokens[f"extract 0 1; {committed}; ==; assert"] == 1
+
+    def test_teal_status_writes_keep_header(self, approval_tokens):
+        """Lifecycle methods write status in place, not over the box header."""
+        # update_status, finalize, both resolve branches and publish
+        assert approval_tokens[f"int {evidence_registry.EVIDENCE_STATUS_OFFSET}"] == 5
+        assert approval_tokens[f"int {evidence_registry.EVIDENCE_STAKE_STATUS_OFFSET}"] == 2
+
+    def test_box_value_includes_stake_status(self, approval_teal):
         """Box value format now includes stake_status as 9th field."""
-        teal = evidence_registry.get_approval_teal()
         # The value construction should include stake_status (STAKE_LOCKED = 0)
         # after stake_amount
-        assert "STAKE_LOCKED" in teal or "int 0" in teal
+        assert "STAKE_LOCKED" in approval_teal or "int 0" in approval_teal
 
 
 # ---- Box Parsing Tests ----
@@ -252,6 +302,58 @@ class TestBoxParsing:
         assert parsed["category"] == "FOOD"
         assert parsed["stake_status"] == 0  # default
 
+    def test_parse_packed_box(self):
+        """Packed version-2 box round-trips, even with '|' in text fields."""
+        submitter = encoding.encode_address(b"\x01" * 32)
+        raw = evidence_registry.build_evidence_box(
+            ipfs_hash="QmPackedHash",
+            category=evidence_registry.CATEGORY_CONSTRUCTION,
+            organization="Org | Inc",
+            description="Cement | steel mismatch",
+            submitter=submitter,
+            timestamp=1700000000,
+            stake_amount=50_000_000,
+        )
+        parsed = evidence_registry.parse_evidence_box(raw)
+        assert parsed["ipfs_hash"] == "QmPackedHash"
+        assert parsed["category"] == "CONSTRUCTION"
+        assert parsed["organization"] == "Org | Inc"
+        assert parsed["description"] == "Cement | steel mismatch"
+        assert parsed["submitter"] == submitter
+        assert parsed["timestamp"] == 1700000000
+        assert parsed["stake_amount"] == "50000000"
+        assert parsed["stake_status"] == evidence_registry.STAKE_LOCKED
+
+    def test_parse_evidence_batch(self):
+        """Batch parse decodes headers into a structured array."""
+        pytest.importorskip("numpy")
+        submitter = encoding.encode_address(b"\x02" * 32)
+        raws = [
+            evidence_registry.build_evidence_box(
+                ipfs_hash=f"QmBatch{i}",
+                category=i % 4,
+                organization=f"Org {i}",
+                description="Batch entry",
+                submitter=submitter,
+                timestamp=1700000000 + i,
+                stake_amount=i * 1_000_000,
+            )
+            for i in range(3)
+        ]
+        headers, tails = evidence_registry.parse_evidence_batch(raws)
+        assert headers["timestamp"].tolist() == [1700000000, 1700000001, 1700000002]
+        assert headers["stake"].tolist() == [0, 1_000_000, 2_000_000]
+        assert headers["category"].tolist() == [0, 1, 2]
+        assert bytes(headers["submitter"][1]) == b"\x02" * 32
+        assert [t["ipfs_hash"] for t in tails] == ["QmBatch0", "QmBatch1", "QmBatch2"]
+
+    def test_pack_box_value(self):
+        """Fields are length-prefixed after a reserved, zeroed header."""
+        buf = evidence_registry.pack_box_value([b"ab", b"", b"c|d"], header_size=3)
+        assert bytes(buf) == b"\x00" * 3 + b"\x00\x02ab" + b"\x00\x00" + b"\x00\x03c|d"
+        with pytest.raises(ValueError):
+            evidence_registry.pack_box_value([b"x" * 0x10000])
+
     def test_make_box_key(self):
         """Box key format: EVD- + 8-byte big-endian counter."""
         key = evidence_registry.make_box_key(1)
@@ -265,6 +367,16 @@ class TestBoxParsing:
         year = time.strftime("%Y")
         assert eid == f"EVD-{year}-00042"
 
+    def test_current_year_rolls_over(self, monkeypatch):
+        """The cached year is refreshed as soon as the local year changes."""
+        import time
+        new_year = time.mktime((2031, 1, 1, 0, 0, 0, 0, 0, -1))
+        monkeypatch.setattr(evidence_registry, "_YEAR_CACHE", [0.0, 0.0, ""])
+        monkeypatch.setattr(time, "time", lambda: new_year - 1)
+        assert evidence_registry.current_year() == "2030"
+        monkeypatch.setattr(time, "time", lambda: new_year)
+        assert evidence_registry.current_year() == "2031"
+
 
 # ---- Stake Constants Tests ----
 
@@ -309,6 +421,60 @@ class TestAlgorandConnection:
         client = get_algod_client()
         assert client is not None
 
+    def test_algod_pool_reuses_clients(self):
+        """Pool hands out distinct clients up to maxsize and reuses released ones."""
+        import queue
+        from backend.services.algorand_client import AlgodPool
+        pool = AlgodPool("", "http://localhost:4001", maxsize=2)
+        a = pool.acquire()
+        b = pool.acquire()
+        assert a is not b
+        assert a.session is not b.session
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.01)
+        pool.release(a)
+        with pool.connection() as c:
+            assert c is a
+        assert pool.acquire() is a
+
+    def test_suggested_params_cached_per_node(self):
+        """Cached params are reused per (token, server), never across nodes."""
+        from backend.services.algorand_client import get_suggested_params
+
+        class _Node:
+            algod_token = ""
+
+            def __init__(self, address, first):
+                self.algod_address = address
+                self.first = first
+                self.calls = 0
+
+            def suggested_params(self):
+                self.calls += 1
+                return type("SP", (), {"first": self.first})()
+
+        a = _Node("http://node-a.test", 100)
+        b = _Node("http://node-b.test", 200)
+        assert get_suggested_params(a).first == 100
+        assert get_suggested_params(b).first == 200
+        assert get_suggested_params(a).first == 100
+        assert (a.calls, b.calls) == (1, 1)
+
+    def test_pooled_client_transport_error(self):
+        """Transport failures surface as the SDK's AlgodHTTPError."""
+        import requests
+        from algosdk import error
+        from backend.services.algorand_client import _PooledAlgodClient
+
+        class _DownSession:
+            def request(self, *args, **kwargs):
+                raise requests.ConnectionError("connection refused")
+
+        client = _PooledAlgodClient("", "http://algod.test", session=_DownSession())
+        with pytest.raises(error.AlgodHTTPError, match="connection refused"):
+            client.status()
+
+    @pytest.mark.xdist_group("network")
     def test_check_connection(self):
         """Can connect to Algorand testnet."""
         from backend.services.algorand_client import check_connection
@@ -0,0 +1,356 @@
+"""
+Tests for WhistleChain Step 3: Inspector Verification (commit-reveal).
+Covers: reveal submission, session listing, consensus tally,
+        and on-chain call wiring (with a stubbed algod client).
+
+Run:
+    cd D:\\Hackathon\\RIFT2\\whistlechain
+    .\\venv\\Scripts\\Activate.ps1
+    python -m pytest tests/test_step3.py -v
+"""
+
+import os
+import sys
+import base64
+import random
+import itertools
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from algosdk import account, encoding, transaction
+
+from services import verification, resolution
+from services.verification import (
+    register_inspector,
+    update_inspector_profile,
+    get_inspector_profile,
+    get_inspector_pool,
+    begin_verification,
+    commit_verdict,
+    reveal_verdict,
+    reveal_verdicts_batch,
+    generate_commit_hash,
+    finalize_verification,
+    iter_sessions,
+    RevealRec,
+    VERDICT_AUTHENTIC,
+    VERDICT_FAKE,
+    VERDICT_INCONCLUSIVE,
+)
+
+_evidence_counter = itertools.count(90001)
+
+
+def _open_reveal_session(num_inspectors: int = 3) -> tuple[str, list[dict]]:
+    """Register fresh inspectors, start a session and commit for each."""
+    evidence_id = f"EVD-2026-{next(_evidence_counter):05d}"
+    category = f"TEST{evidence_id[-5:]}"
+    inspectors = []
+    for i in range(num_inspectors):
+        pk, addr = account.generate_account()
+        register_inspector(addr, f"Inspector {i}", [category])
+        inspectors.append({"address": addr, "private_key": pk})
+
+    assert begin_verification(evidence_id, category)["status"] == "UNDER_VERIFICATION"
+    for ins in inspectors:
+        commit = generate_commit_hash(VERDICT_AUTHENTIC)
+        ins["nonce"] = commit["nonce"]
+        commit_verdict(evidence_id, ins["address"], commit["commit_hash"])
+    return evidence_id, inspectors
+
+
+class _FakeAlgod:
+    """Stand-in algod client; rejects groups and txns from `bad` senders."""
+
+    def __init__(self, bad: set[str] = frozenset()):
+        self.bad = bad
+        self.sent = []
+
+    def suggested_params(self):
+        return transaction.SuggestedParams(
+            1000, 1, 1000, "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", flat_fee=True
+        )
+
+    def send_transactions(self, signed):
+        if any(s.transaction.sender in self.bad for s in signed):
+            raise RuntimeError("logic eval error")
+        self.sent.extend(signed)
+
+    def send_transaction(self, signed):
+        if signed.transaction.sender in self.bad:
+            raise RuntimeError("logic eval error")
+        self.sent.append(signed)
+        return signed.get_txid()
+
+
+class _FakeRegistryNode(_FakeAlgod):
+    """
+    Fake algod holding evidence boxes; applies the header writes that
+    finalize_verification / resolve_evidence make in the contract.
+    """
+
+    def __init__(self, registry, boxes: dict[bytes, bytearray]):
+        super().__init__()
+        self.registry = registry
+        self.boxes = boxes
+
+    def application_box_by_name(self, app_id, name):
+        return {"name": name, "value": base64.b64encode(bytes(self.boxes[name])).decode()}
+
+    def send_transaction(self, signed):
+        args = signed.transaction.app_args
+        box = self.boxes[args[1]]
+        status_at = self.registry.EVIDENCE_STATUS_OFFSET
+        if args[0] == verification.METHOD_SELECTORS["finalize_verification"]:
+            assert len(args[2]) == 8
+            box[status_at:status_at + 8] = args[2]
+        elif args[0] == verification.METHOD_SELECTORS["resolve_evidence"]:
+            assert len(args[5]) == 8
+            box[status_at:status_at + 8] = args[5]
+            stake_status = (
+                self.registry.STAKE_REFUNDED if int.from_bytes(args[2], "big") == 1
+                else self.registry.STAKE_FORFEITED
+            )
+            box[self.registry.EVIDENCE_STAKE_STATUS_OFFSET] = stake_status
+        return super().send_transaction(signed)
+
+
+@pytest.fixture
+def fake_algod(monkeypatch):
+    def install(bad: set[str] = frozenset(), client: _FakeAlgod = None) -> _FakeAlgod:
+        client = client or _FakeAlgod(bad)
+        monkeypatch.setattr(verification, "get_algod_client", lambda: client)
+        monkeypatch.setattr(resolution, "get_algod_client", lambda: client)
+        monkeypatch.setattr(verification, "get_suggested_params", lambda c: c.suggested_params())
+        monkeypatch.setattr(verification.transaction, "wait_for_confirmation", lambda *a, **k: {})
+        return client
+    return install
+
+
+# ---- Inspector Profile Tests ----
+
+class TestInspectorProfiles:
+    """Test inspector profile responses."""
+
+    def test_profiles_format_registration_time(self):
+        """Every profile response has registered_at and no raw ns field."""
+        addr = account.generate_account()[1]
+        register_inspector(addr, "Profile Inspector", ["PROFILETEST"])
+        responses = [
+            get_inspector_profile(addr),
+            update_inspector_profile(addr, designation="Senior")["profile"],
+            *[p for p in get_inspector_pool("PROFILETEST") if p["address"] == addr],
+        ]
+        assert len(responses) == 3
+        for profile in responses:
+            assert "registered_ts" not in profile
+            assert len(profile["registered_at"]) == len("2026-01-01 00:00:00")
+        assert responses[1]["designation"] == "Senior"
+        assert "registered_ts" in verification._inspector_registry[addr]
+
+
+# ---- On-Chain Reveal Tests ----
+
+class TestOnChainReveal:
+    """Test reveal_verdict / reveal_verdicts_batch on-chain submission."""
+
+    def test_reveal_returns_tx_id(self, fake_algod):
+        """Single reveal is sent synchronously and returns its tx id."""
+        client = fake_algod()
+        evidence_id, inspectors = _open_reveal_session()
+        ins = inspectors[0]
+        result = reveal_verdict(
+            evidence_id, ins["address"], VERDICT_AUTHENTIC, ins["nonce"],
+            "QmJustification", app_id=1234, inspector_private_key=ins["private_key"],
+        )
+        assert result["tx_id"] == client.sent[0].get_txid()
+        session = verification._verification_sessions[evidence_id]
+        assert session["reveals"][ins["address"]].tx_id == result["tx_id"]
+
+    def test_reveal_reports_onchain_error(self, fake_algod):
+        """A failed on-chain reveal is surfaced, not swallowed."""
+        evidence_id, inspectors = _open_reveal_session()
+        ins = inspectors[0]
+        fake_algod(bad={ins["address"]})
+        result = reveal_verdict(
+            evidence_id, ins["address"], VERDICT_AUTHENTIC, ins["nonce"],
+            "QmJustification", app_id=1234, inspector_private_key=ins["private_key"],
+        )
+        assert result["tx_id"] is None
+        assert "logic eval error" in result["on_chain_error"]
+
+    def test_batch_reports_per_reveal_failures(self, fake_algod):
+        """A rejected group is retried per txn so only the bad reveal fails."""
+        evidence_id, inspectors = _open_reveal_session(num_inspectors=3)
+        bad = inspectors[1]["address"]
+        client = fake_algod(bad={bad})
+        reveals = []
+        for ins in inspectors:
+            reveal_verdict(evidence_id, ins["address"], VERDICT_AUTHENTIC, ins["nonce"], "QmJustification")
+            reveals.append({
+                "inspector": ins["address"],
+                "verdict": VERDICT_AUTHENTIC,
+                "nonce": ins["nonce"],
+                "justification_ipfs": "QmJustification",
+            })
+        keys = {ins["address"]: ins["private_key"] for ins in inspectors}
+
+        results = reveal_verdicts_batch(evidence_id, reveals, keys, app_id=1234)
+        assert [r["inspector"] for r in results] == [ins["address"] for ins in inspectors]
+        assert results[1]["tx_id"] is None and results[1]["error"]
+        assert results[0]["tx_id"] and results[2]["tx_id"]
+        assert len(client.sent) == 2
+
+        session = verification._verification_sessions[evidence_id]
+        assert session["reveals"][inspectors[0]["address"]].tx_id == results[0]["tx_id"]
+        assert session["reveals"][bad].tx_id is None
+
+
+# ---- Session Listing Tests ----
+
+class TestSessionListing:
+    """Test iter_sessions filtering and pagination."""
+
+    def test_phase_filter_uses_phase_order(self):
+        """Phase filter returns only that phase, in order of entry."""
+        first, _ = _open_reveal_session()
+        second, _ = _open_reveal_session()
+        reveal_ids = [row["evidence_id"] for row in iter_sessions(phase="reveal")]
+        assert reveal_ids.index(first) < reveal_ids.index(second)
+        assert all(row["phase"] == "REVEAL" for row in iter_sessions(phase="REVEAL"))
+        assert first not in [row["evidence_id"] for row in iter_sessions(phase="COMMIT")]
+
+    def test_pagination(self):
+        """offset/limit slice the listing; negative values are rejected."""
+        _open_reveal_session()
+        _open_reveal_session()
+        everything = [row["evidence_id"] for row in iter_sessions()]
+        page = [row["evidence_id"] for row in iter_sessions(limit=1, offset=1)]
+        assert page == everything[1:2]
+        with pytest.raises(ValueError):
+            list(iter_sessions(offset=-1))
+        with pytest.raises(ValueError):
+            list(iter_sessions(limit=-1))
+
+    def test_timestamp_formatting(self):
+        """Nanosecond timestamps format per whole second; 0 formats as ''."""
+        import time
+        ns = 1_790_000_000_123_456_789
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1_790_000_000))
+        assert verification._fmt_ns(ns) == expected
+        assert verification._fmt_ns(ns + 800_000_000) == expected
+        assert verification._fmt_ns(0) == ""
+
+
+# ---- Consensus Tests ----
+
+def _reveals(verdicts: list[int]) -> dict[str, RevealRec]:
+    return {
+        f"ADDR{i}": RevealRec(v, "", "QmJustification", 0, 0, "nonce")
+        for i, v in enumerate(verdicts)
+    }
+
+
+def _rep_table(n: int, seed: int) -> dict[str, dict]:
+    rng = random.Random(seed)
+    return {
+        f"ADDR{i}": {
+            "credibility_weight": round(rng.uniform(0.1, 1.0), 3),
+            "total_votes": 0,
+            "consensus_matches": 0,
+            "outlier_count": 0,
+            "consistency_score": 1.0,
+        }
+        for i in range(n)
+    }
+
+
+class TestConsensus:
+    """Test the weighted consensus tally."""
+
+    def test_unknown_verdicts_add_weight_only(self):
+        """Out-of-range verdicts count toward the total but no verdict."""
+        final, counts, total = verification._tally_and_update(
+            _reveals([VERDICT_AUTHENTIC] * 3 + [7, -1]), {}
+        )
+        assert final == VERDICT_INCONCLUSIVE  # 3/5 = 60% < 67%
+        assert total == 5.0
+        assert counts[VERDICT_AUTHENTIC] == 3.0
+        assert counts[VERDICT_INCONCLUSIVE] == 0.0
+
+    def test_jit_tally_matches_python(self):
+        """Large pools (numba path) tally exactly like the pure-Python kernel."""
+        pytest.importorskip("numba")
+        n = verification.JIT_CONSENSUS_MIN_POOL + 36
+        rng = random.Random(7)
+        choices = [VERDICT_AUTHENTIC, VERDICT_FAKE, VERDICT_INCONCLUSIVE, 9, -2]
+        for skew in (VERDICT_AUTHENTIC, VERDICT_FAKE, None):
+            verdicts = [
+                skew if skew and rng.random() < 0.8 else rng.choice(choices)
+                for _ in range(n)
+            ]
+            reps = _rep_table(n, seed=n)
+            weights = [reps[f"ADDR{i}"]["credibility_weight"] for i in range(n)]
+            expected_counts = [0.0, 0.0, 0.0, 0.0]
+            expected = verification._consensus_kernel(
+                [v if v in verification.VERDICT_LABELS else 0 for v in verdicts],
+                weights, expected_counts, verification.CONSENSUS_THRESHOLD,
+            )
+
+            final, counts, total = verification._tally_and_update(_reveals(verdicts), reps)
+            assert (final, pytest.approx(total)) == expected
+            assert list(counts) == pytest.approx(expected_counts)
+
+
+# ---- Evidence Box Lifecycle Tests ----
+
+class TestEvidenceBoxLifecycle:
+    """Status writes keep the packed (version 2) evidence box intact."""
+
+    def test_finalize_then_resolve_v2_box(self, fake_algod, registry):
+        """Finalize and resolve update the header; resolve reads the real stake."""
+        evidence_id, inspectors = _open_reveal_session()
+        for ins in inspectors:
+            reveal_verdict(evidence_id, ins["address"], VERDICT_AUTHENTIC, ins["nonce"], "QmJustification")
+
+        submitter = account.generate_account()[1]
+        box_key = verification._make_evidence_box_key(evidence_id)
+        original = registry.build_evidence_box(
+            ipfs_hash="QmLifecycle",
+            category=registry.CATEGORY_FINANCIAL,
+            organization="Org",
+            description="Lifecycle",
+            submitter=submitter,
+            timestamp=1700000000,
+            stake_amount=25_000_000,
+        )
+        client = _FakeRegistryNode(registry, {box_key: bytearray(original)})
+        fake_algod(client=client)
+        admin_pk = account.generate_account()[0]
+
+        result = finalize_verification(evidence_id, app_id=1234, admin_private_key=admin_pk)
+        assert result["status"] == "VERIFIED" and result["tx_id"]
+        parsed = registry.parse_evidence_box(bytes(client.boxes[box_key]))
+        assert parsed["status"] == registry.STATUS_VERIFIED
+        assert parsed["submitter"] == submitter
+        assert parsed["ipfs_hash"] == "QmLifecycle"
+
+        # No submission record: resolution falls back to the on-chain box
+        result = resolution.resolve_evidence(evidence_id, app_id=1234, admin_private_key=admin_pk)
+        assert result["tx_id"]
+        resolve_args = client.sent[-1].transaction.app_args
+        assert resolve_args[3] == encoding.decode_address(submitter)
+        assert int.from_bytes(resolve_args[4], "big") == 25_000_000
+
+        parsed = registry.parse_evidence_box(bytes(client.boxes[box_key]))
+        assert parsed["status"] == registry.STATUS_RESOLVED
+        assert parsed["stake_status"] == registry.STAKE_REFUNDED
+        assert parsed["stake_amount"] == "25000000"
+        assert bytes(client.boxes[box_key])[registry.EVIDENCE_STATUS_OFFSET + 8:] == (
+            original[registry.EVIDENCE_STATUS_OFFSET + 8:registry.EVIDENCE_STAKE_STATUS_OFFSET]
+            + bytes([registry.STAKE_REFUNDED])
+            + original[registry.EVIDENCE_STAKE_STATUS_OFFSET + 1:]
+        )